@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 from typing import List, Optional
 
-from pymongo import MongoClient
+from pymongo import MongoClient, ReplaceOne
 from pymongo.collection import Collection
 from pymongo.database import Database
 
@@ -42,6 +42,19 @@ class MongoUserRepository:
         self.collection.replace_one({"_id": user.id}, doc, upsert=True)
         logger.debug(f"Saved user: {user.id}")
 
+    def save_users(self, users: List[User]) -> None:
+        """Save or update several users in a single bulk write."""
+        if not users:
+            return
+        self.collection.bulk_write(
+            [
+                ReplaceOne({"_id": user.id}, self._user_to_doc(user), upsert=True)
+                for user in users
+            ],
+            ordered=False,
+        )
+        logger.debug(f"Saved {len(users)} users")
+
     def get_user(self, user_id: str) -> Optional[User]:
         """Retrieve a user by ID."""
         doc = self.collection.find_one({"_id": user_id})
@@ -238,6 +251,21 @@ class MongoMissionRepository:
         self.collection.replace_one({"_id": mission.id}, doc, upsert=True)
         logger.debug(f"Saved mission: {mission.id}")
 
+    def save_missions(self, missions: List[Mission]) -> None:
+        """Save or update several missions in a single bulk write."""
+        if not missions:
+            return
+        self.collection.bulk_write(
+            [
+                ReplaceOne(
+                    {"_id": mission.id}, self._mission_to_doc(mission), upsert=True
+                )
+                for mission in missions
+            ],
+            ordered=False,
+        )
+        logger.debug(f"Saved {len(missions)} missions")
+
     def get_mission(self, mission_id: str) -> Optional[Mission]:
         """Retrieve a mission by ID."""
         doc = self.collection.find_one({"_id": mission_id})
@@ -372,34 +400,30 @@ class MongoObjectiveRepository:
 
     def save_objective(self, objective: Objective, mission_id: str) -> None:
         """Save or update an objective within a mission."""
+        self.save_objectives([objective], mission_id)
+        logger.debug(f"Saved objective: {objective.id} in mission: {mission_id}")
+
+    def save_objectives(self, objectives: List[Objective], mission_id: str) -> None:
+        """Save or update several objectives within a mission in one update."""
         mission_doc = self.mission_collection.find_one({"_id": mission_id})
         if not mission_doc:
             raise ValueError(f"Mission {mission_id} not found")
 
-        objectives = mission_doc.get("objectives", [])
-        obj_index = next(
-            (i for i, obj in enumerate(objectives) if obj["id"] == objective.id),
-            None,
-        )
+        stored = mission_doc.get("objectives", [])
+        index_by_id = {obj["id"]: i for i, obj in enumerate(stored)}
 
-        obj_doc = {
-            "id": objective.id,
-            "description": objective.description,
-            "type": objective.type,
-            "target_id": objective.target_id,
-            "position": list(objective.position) if objective.position else None,
-            "completed": objective.completed,
-        }
-
-        if obj_index is not None:
-            objectives[obj_index] = obj_doc
-        else:
-            objectives.append(obj_doc)
+        for objective in objectives:
+            obj_doc = self._objective_to_doc(objective)
+            obj_index = index_by_id.get(objective.id)
+            if obj_index is not None:
+                stored[obj_index] = obj_doc
+            else:
+                index_by_id[objective.id] = len(stored)
+                stored.append(obj_doc)
 
         self.mission_collection.update_one(
-            {"_id": mission_id}, {"$set": {"objectives": objectives}}
+            {"_id": mission_id}, {"$set": {"objectives": stored}}
         )
-        logger.debug(f"Saved objective: {objective.id} in mission: {mission_id}")
 
     def get_objective(self, objective_id: str, mission_id: str) -> Optional[Objective]:
         """Retrieve an objective by ID within a mission."""
@@ -451,6 +475,18 @@ class MongoObjectiveRepository:
         )
         logger.debug(f"Deleted objective: {objective_id} from mission: {mission_id}")
 
+    @staticmethod
+    def _objective_to_doc(objective: Objective) -> dict:
+        """Convert Objective model to a nested MongoDB document."""
+        return {
+            "id": objective.id,
+            "description": objective.description,
+            "type": objective.type,
+            "target_id": objective.target_id,
+            "position": list(objective.position) if objective.position else None,
+            "completed": objective.completed,
+        }
+
 
 class MongoDatabase:
     """
@@ -459,14 +495,19 @@ class MongoDatabase:
     Provides access to repositories and manages database connections.
     """
 
-    def __init__(self, config: MongoConfig) -> None:
+    def __init__(
+        self, config: MongoConfig, client: Optional[MongoClient] = None
+    ) -> None:
         """
         Initialize MongoDB database connection.
 
         Args:
             config: MongoDB configuration
+            client: Optional existing client to reuse. An injected client is
+                owned by the caller and is not closed by `disconnect`.
         """
         self.config = config
+        self._injected_client = client
         self.client: Optional[MongoClient] = None
         self.db: Optional[Database] = None
         self._user_repo: Optional[MongoUserRepository] = None
@@ -477,8 +518,11 @@ class MongoDatabase:
     def connect(self) -> None:
         """Establish connection to MongoDB."""
         try:
-            connection_string = self.config.get_connection_string()
-            self.client = MongoClient(connection_string)
+            if self._injected_client is not None:
+                self.client = self._injected_client
+            else:
+                connection_string = self.config.get_connection_string()
+                self.client = MongoClient(connection_string)
             self.db = self.client[self.config.database]
             # Test connection
             self.client.server_info()
@@ -489,7 +533,7 @@ class MongoDatabase:
 
     def disconnect(self) -> None:
         """Close MongoDB connection."""
-        if self.client:
+        if self.client and self.client is not self._injected_client:
             self.client.close()
             logger.info("Disconnected from MongoDB")
 
@@ -421,13 +421,14 @@ def create_app(auth_service: Optional[AuthService] = None) -> FastAPI:
                 is_public=payload.is_public,
             )
 
-            # Add objectives from request
+            # Add objectives from request; update_project stamps the time once
             for obj_template in payload.objectives:
                 project.add_objective_template(
                     description=obj_template.description,
                     obj_type=obj_template.type,
                     target_id=obj_template.target_id,
                     position=obj_template.position,
+                    now=project.updated_at,
                 )
 
             # Save project with objectives
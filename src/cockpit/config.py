@@ -12,7 +12,7 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MongoConfig:
     """
     MongoDB connection configuration.
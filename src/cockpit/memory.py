@@ -7,8 +7,10 @@ requiring a backing database.
 
 from __future__ import annotations
 
+import itertools
 from copy import deepcopy
-from typing import Dict, List, Optional
+from dataclasses import replace
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from src.cockpit.storage import (
     AuthRepository,
@@ -19,37 +21,141 @@ from src.cockpit.storage import (
 from src.models import AuthProfile, Mission, Project, User
 
 
+def clone_mission(mission: Mission) -> Mission:
+    """
+    Copy a mission without going through `deepcopy`.
+
+    Objectives and the mutable containers are duplicated; every other field
+    holds an immutable value and is shared.
+    """
+    return replace(
+        mission,
+        objectives=[replace(objective) for objective in mission.objectives],
+        completion_criteria=dict(mission.completion_criteria),
+        allowed_ship_types=list(mission.allowed_ship_types),
+        failure_conditions=list(mission.failure_conditions),
+    )
+
+
+class _FieldIndex:
+    """
+    Secondary index from field values to the IDs stored under them.
+
+    Each ID gets a sequence number when it is first indexed and keeps it
+    across re-indexing until it is removed, so `select` returns IDs in the
+    same order as the repository's storage dict. The indexed values are
+    recorded per ID, so re-indexing stays correct even when the caller
+    mutated the stored instance in place.
+    """
+
+    def __init__(self, *fields: str) -> None:
+        self._fields = fields
+        self._buckets: Dict[str, Dict[Any, Set[str]]] = {name: {} for name in fields}
+        self._keys: Dict[str, Tuple[Any, ...]] = {}
+        self._order: Dict[str, int] = {}
+        self._sequence = itertools.count()
+
+    def add(self, item_id: str, item: Any) -> None:
+        """Index `item` under its current field values."""
+        keys = tuple(getattr(item, name) for name in self._fields)
+        if self._keys.get(item_id) == keys:
+            return
+        self._unbucket(item_id)
+        self._keys[item_id] = keys
+        if item_id not in self._order:
+            self._order[item_id] = next(self._sequence)
+        for name, key in zip(self._fields, keys, strict=True):
+            self._buckets[name].setdefault(key, set()).add(item_id)
+
+    def remove(self, item_id: str) -> None:
+        """Drop `item_id` from every bucket."""
+        self._unbucket(item_id)
+        self._order.pop(item_id, None)
+
+    def select(self, **criteria: Any) -> Optional[List[str]]:
+        """
+        Return IDs matching every criterion that is not None.
+
+        Returns:
+            Matching IDs in storage order, or None when no criterion is set
+        """
+        buckets = [
+            self._buckets[name].get(value, set())
+            for name, value in criteria.items()
+            if value is not None
+        ]
+        if not buckets:
+            return None
+        return sorted(set.intersection(*buckets), key=self._order.__getitem__)
+
+    def clear(self) -> None:
+        """Remove every indexed ID."""
+        for buckets in self._buckets.values():
+            buckets.clear()
+        self._keys.clear()
+        self._order.clear()
+
+    def _unbucket(self, item_id: str) -> None:
+        """Drop `item_id` from its buckets, keeping its sequence number."""
+        keys = self._keys.pop(item_id, None)
+        if keys is None:
+            return
+        for name, key in zip(self._fields, keys, strict=True):
+            bucket = self._buckets[name][key]
+            bucket.discard(item_id)
+            if not bucket:
+                del self._buckets[name][key]
+
+
 class InMemoryUserRepository(UserRepository):
     """Simple in-memory user storage."""
 
     def __init__(self) -> None:
         self._users: Dict[str, User] = {}
+        self._user_ids_by_username: Dict[str, str] = {}
+        self._user_ids_by_email: Dict[str, str] = {}
 
     def save_user(self, user: User) -> None:
+        self._unindex(user.id)
         self._users[user.id] = deepcopy(user)
+        self._user_ids_by_username[user.username] = user.id
+        self._user_ids_by_email[user.email] = user.id
 
     def get_user(self, user_id: str) -> Optional[User]:
         user = self._users.get(user_id)
-        return deepcopy(user) if user else None
+        return deepcopy(user) if user is not None else None
 
     def get_user_by_username(self, username: str) -> Optional[User]:
-        for user in self._users.values():
-            if user.username == username:
-                return deepcopy(user)
-        return None
+        user_id = self._user_ids_by_username.get(username)
+        return self.get_user(user_id) if user_id is not None else None
 
     def get_user_by_email(self, email: str) -> Optional[User]:
-        for user in self._users.values():
-            if user.email == email:
-                return deepcopy(user)
-        return None
+        user_id = self._user_ids_by_email.get(email)
+        return self.get_user(user_id) if user_id is not None else None
 
     def list_users(self) -> List[User]:
         return [deepcopy(user) for user in self._users.values()]
 
     def delete_user(self, user_id: str) -> None:
+        self._unindex(user_id)
         self._users.pop(user_id, None)
 
+    def clear(self) -> None:
+        """Remove all stored users."""
+        self._users.clear()
+        self._user_ids_by_username.clear()
+        self._user_ids_by_email.clear()
+
+    def _unindex(self, user_id: str) -> None:
+        """Drop the username/email entries that point at a stored user."""
+        user = self._users.get(user_id)
+        if user is None:
+            return
+        if self._user_ids_by_username.get(user.username) == user_id:
+            del self._user_ids_by_username[user.username]
+        if self._user_ids_by_email.get(user.email) == user_id:
+            del self._user_ids_by_email[user.email]
+
 
 class InMemoryAuthRepository(AuthRepository):
     """In-memory auth profile storage."""
@@ -68,19 +174,26 @@ class InMemoryAuthRepository(AuthRepository):
 
     def _get(self, profile_id: str) -> Optional[AuthProfile]:
         profile = self._profiles_by_id.get(profile_id)
-        return deepcopy(profile) if profile else None
+        return deepcopy(profile) if profile is not None else None
 
     def get_by_username(self, username: str) -> Optional[AuthProfile]:
         profile_id = self._profiles_by_username.get(username)
-        return self._get(profile_id) if profile_id else None
+        return self._get(profile_id) if profile_id is not None else None
 
     def get_by_email(self, email: str) -> Optional[AuthProfile]:
         profile_id = self._profiles_by_email.get(email)
-        return self._get(profile_id) if profile_id else None
+        return self._get(profile_id) if profile_id is not None else None
 
     def get_by_user_id(self, user_id: str) -> Optional[AuthProfile]:
         profile_id = self._profiles_by_user_id.get(user_id)
-        return self._get(profile_id) if profile_id else None
+        return self._get(profile_id) if profile_id is not None else None
+
+    def clear(self) -> None:
+        """Remove all stored auth profiles."""
+        self._profiles_by_id.clear()
+        self._profiles_by_username.clear()
+        self._profiles_by_email.clear()
+        self._profiles_by_user_id.clear()
 
 
 class InMemoryProjectRepository(ProjectRepository):
@@ -88,15 +201,17 @@ class InMemoryProjectRepository(ProjectRepository):
 
     def __init__(self) -> None:
         self._projects: Dict[str, Project] = {}
+        self._index = _FieldIndex("user_id", "is_public", "mission_type")
 
     def save_project(self, project: Project) -> None:
         """Save or update a project."""
         self._projects[project.id] = deepcopy(project)
+        self._index.add(project.id, project)
 
     def get_project(self, project_id: str) -> Optional[Project]:
         """Retrieve a project by ID."""
         project = self._projects.get(project_id)
-        return deepcopy(project) if project else None
+        return deepcopy(project) if project is not None else None
 
     def list_projects(
         self,
@@ -105,20 +220,35 @@ class InMemoryProjectRepository(ProjectRepository):
         mission_type: Optional[str] = None,
     ) -> List[Project]:
         """List projects with optional filtering."""
-        results = []
-        for project in self._projects.values():
-            if user_id is not None and project.user_id != user_id:
-                continue
-            if is_public is not None and project.is_public != is_public:
-                continue
-            if mission_type is not None and project.mission_type != mission_type:
-                continue
-            results.append(deepcopy(project))
-        return results
+        project_ids = self._index.select(
+            user_id=user_id, is_public=is_public, mission_type=mission_type
+        )
+        if project_ids is None:
+            return [deepcopy(project) for project in self._projects.values()]
+        return [deepcopy(self._projects[project_id]) for project_id in project_ids]
 
     def delete_project(self, project_id: str) -> None:
         """Delete a project by ID."""
         self._projects.pop(project_id, None)
+        self._index.remove(project_id)
+
+    def bulk_load(self, projects: Iterable[Project]) -> None:
+        """
+        Store many projects at once, bypassing service validation.
+
+        Intended for seeding fixtures. Unlike `save_project`, the instances
+        are stored as given rather than copied, so callers must not mutate
+        them afterwards.
+        """
+        loaded = {project.id: project for project in projects}
+        self._projects.update(loaded)
+        for project_id, project in loaded.items():
+            self._index.add(project_id, project)
+
+    def clear(self) -> None:
+        """Remove all stored projects."""
+        self._projects.clear()
+        self._index.clear()
 
 
 class InMemoryMissionRepository(MissionRepository):
@@ -126,15 +256,18 @@ class InMemoryMissionRepository(MissionRepository):
 
     def __init__(self) -> None:
         self._missions: Dict[str, Mission] = {}
+        self._index = _FieldIndex("status", "type")
 
     def save_mission(self, mission: Mission) -> None:
         """Save or update a mission."""
-        self._missions[mission.id] = deepcopy(mission)
+        stored = clone_mission(mission)
+        self._missions[mission.id] = stored
+        self._index.add(mission.id, stored)
 
     def get_mission(self, mission_id: str) -> Optional[Mission]:
         """Retrieve a mission by ID."""
         mission = self._missions.get(mission_id)
-        return deepcopy(mission) if mission else None
+        return clone_mission(mission) if mission is not None else None
 
     def list_missions(
         self,
@@ -143,15 +276,30 @@ class InMemoryMissionRepository(MissionRepository):
         mission_type: Optional[str] = None,
     ) -> List[Mission]:
         """List missions with optional filtering."""
-        results = []
-        for mission in self._missions.values():
-            if status is not None and mission.status != status:
-                continue
-            if mission_type is not None and mission.type != mission_type:
-                continue
-            results.append(deepcopy(mission))
-        return results
+        mission_ids = self._index.select(status=status, type=mission_type)
+        if mission_ids is None:
+            return [clone_mission(mission) for mission in self._missions.values()]
+        return [clone_mission(self._missions[mission_id]) for mission_id in mission_ids]
 
     def delete_mission(self, mission_id: str) -> None:
         """Delete a mission by ID."""
         self._missions.pop(mission_id, None)
+        self._index.remove(mission_id)
+
+    def bulk_load(self, missions: Iterable[Mission]) -> None:
+        """
+        Store many missions at once, bypassing service validation.
+
+        Intended for seeding fixtures. Unlike `save_mission`, the instances
+        are stored as given rather than copied, so callers must not mutate
+        them afterwards.
+        """
+        loaded = {mission.id: mission for mission in missions}
+        self._missions.update(loaded)
+        for mission_id, mission in loaded.items():
+            self._index.add(mission_id, mission)
+
+    def clear(self) -> None:
+        """Remove all stored missions."""
+        self._missions.clear()
+        self._index.clear()
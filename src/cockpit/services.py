@@ -6,11 +6,60 @@ Services that coordinate domain logic with storage repositories.
 
 from __future__ import annotations
 
-from typing import List, Optional
+import uuid
+from typing import Any, Callable, List, Optional
 
 from src.cockpit.storage import MissionRepository, ProjectRepository, UserRepository
 from src.models import Mission, Objective, Project, User
 
+_VALID_MISSION_TYPES = frozenset({"tutorial", "free_flight", "challenge"})
+_VALID_DIFFICULTIES = frozenset({"beginner", "intermediate", "advanced"})
+
+
+_PATCHABLE_PROJECT_FIELDS = frozenset(
+    {
+        "name",
+        "description",
+        "mission_type",
+        "difficulty",
+        "target_body_id",
+        "start_position",
+        "max_fuel",
+        "time_limit",
+        "allowed_ship_types",
+        "failure_conditions",
+        "is_public",
+    }
+)
+
+
+def _validate_mission_type(mission_type: str) -> None:
+    """Raise ValueError unless `mission_type` is a known mission type."""
+    if mission_type not in _VALID_MISSION_TYPES:
+        raise ValueError(
+            f"Invalid mission type: {mission_type}. "
+            "Must be one of: tutorial, free_flight, challenge"
+        )
+
+
+def _validate_difficulty(difficulty: str) -> None:
+    """Raise ValueError unless `difficulty` is a known difficulty level."""
+    if difficulty not in _VALID_DIFFICULTIES:
+        raise ValueError(
+            f"Invalid difficulty: {difficulty}. "
+            "Must be one of: beginner, intermediate, advanced"
+        )
+
+
+def _new_mission_id() -> str:
+    """Generate a random mission ID."""
+    return f"mission-{uuid.uuid4().hex[:8]}"
+
+
+def _new_project_id() -> str:
+    """Generate a random project ID."""
+    return f"project-{uuid.uuid4().hex[:8]}"
+
 
 class UserService:
     """
@@ -56,8 +105,6 @@ class UserService:
             raise ValueError(f"Email '{email}' already exists")
 
         if not user_id:
-            import uuid
-
             user_id = f"user-{uuid.uuid4().hex[:8]}"
 
         user = User(
@@ -98,14 +145,21 @@ class MissionService:
     Coordinates mission operations with storage repositories.
     """
 
-    def __init__(self, mission_repository: MissionRepository) -> None:
+    def __init__(
+        self,
+        mission_repository: MissionRepository,
+        id_factory: Callable[[], str] = _new_mission_id,
+    ) -> None:
         """
         Initialize mission service.
 
         Args:
             mission_repository: Mission repository implementation
+            id_factory: Callable producing IDs for missions created without
+                one (random `mission-xxxxxxxx` IDs by default)
         """
         self.mission_repository = mission_repository
+        self.id_factory = id_factory
 
     def create_mission(
         self,
@@ -148,22 +202,12 @@ class MissionService:
         if not name or not name.strip():
             raise ValueError("Mission name cannot be empty")
 
-        if mission_type not in ("tutorial", "free_flight", "challenge"):
-            raise ValueError(
-                f"Invalid mission type: {mission_type}. "
-                "Must be one of: tutorial, free_flight, challenge"
-            )
+        _validate_mission_type(mission_type)
 
-        if difficulty not in ("beginner", "intermediate", "advanced"):
-            raise ValueError(
-                f"Invalid difficulty: {difficulty}. "
-                "Must be one of: beginner, intermediate, advanced"
-            )
+        _validate_difficulty(difficulty)
 
         if not mission_id:
-            import uuid
-
-            mission_id = f"mission-{uuid.uuid4().hex[:8]}"
+            mission_id = self.id_factory()
 
         mission = Mission(
             id=mission_id,
@@ -199,8 +243,6 @@ class MissionService:
         Returns:
             Created mission instance
         """
-        import uuid
-
         # Convert project objectives to mission objectives
         objectives = []
         for idx, obj_template in enumerate(project.objectives):
@@ -280,14 +322,21 @@ class ProjectService:
     and later used to generate missions.
     """
 
-    def __init__(self, project_repository: ProjectRepository) -> None:
+    def __init__(
+        self,
+        project_repository: ProjectRepository,
+        id_factory: Callable[[], str] = _new_project_id,
+    ) -> None:
         """
         Initialize project service.
 
         Args:
             project_repository: Project repository implementation
+            id_factory: Callable producing IDs for projects created without
+                one (random `project-xxxxxxxx` IDs by default)
         """
         self.project_repository = project_repository
+        self.id_factory = id_factory
 
     def create_project(
         self,
@@ -332,22 +381,12 @@ class ProjectService:
         if not name or not name.strip():
             raise ValueError("Project name cannot be empty")
 
-        if mission_type not in ("tutorial", "free_flight", "challenge"):
-            raise ValueError(
-                f"Invalid mission type: {mission_type}. "
-                "Must be one of: tutorial, free_flight, challenge"
-            )
+        _validate_mission_type(mission_type)
 
-        if difficulty not in ("beginner", "intermediate", "advanced"):
-            raise ValueError(
-                f"Invalid difficulty: {difficulty}. "
-                "Must be one of: beginner, intermediate, advanced"
-            )
+        _validate_difficulty(difficulty)
 
         if not project_id:
-            import uuid
-
-            project_id = f"project-{uuid.uuid4().hex[:8]}"
+            project_id = self.id_factory()
 
         project = Project(
             id=project_id,
@@ -427,20 +466,56 @@ class ProjectService:
         if not project.name or not project.name.strip():
             raise ValueError("Project name cannot be empty")
 
-        if project.mission_type not in ("tutorial", "free_flight", "challenge"):
-            raise ValueError(
-                f"Invalid mission type: {project.mission_type}. "
-                "Must be one of: tutorial, free_flight, challenge"
-            )
+        _validate_mission_type(project.mission_type)
+
+        _validate_difficulty(project.difficulty)
+
+        project.update_metadata()
+        self.project_repository.save_project(project)
+
+    def patch_project(self, project_id: str, **changes: Any) -> Project:
+        """
+        Apply a partial update to a stored project.
 
-        if project.difficulty not in ("beginner", "intermediate", "advanced"):
+        Only the supplied fields are validated; the rest of the project is
+        left as stored.
+
+        Args:
+            project_id: Project ID
+            **changes: New values for editable project fields
+
+        Returns:
+            Updated project instance
+
+        Raises:
+            ValueError: If the project does not exist, a field is not
+                editable, or a supplied name/type/difficulty is invalid
+        """
+        project = self.project_repository.get_project(project_id)
+        if project is None:
+            raise ValueError(f"Project '{project_id}' not found")
+
+        unknown = changes.keys() - _PATCHABLE_PROJECT_FIELDS
+        if unknown:
             raise ValueError(
-                f"Invalid difficulty: {project.difficulty}. "
-                "Must be one of: beginner, intermediate, advanced"
+                f"Cannot patch project fields: {', '.join(sorted(unknown))}"
             )
 
+        if "name" in changes:
+            name = changes["name"]
+            if not name or not name.strip():
+                raise ValueError("Project name cannot be empty")
+            changes["name"] = name.strip()
+        if "mission_type" in changes:
+            _validate_mission_type(changes["mission_type"])
+        if "difficulty" in changes:
+            _validate_difficulty(changes["difficulty"])
+
+        for field_name, value in changes.items():
+            setattr(project, field_name, value)
         project.update_metadata()
         self.project_repository.save_project(project)
+        return project
 
     def delete_project(self, project_id: str) -> None:
         """
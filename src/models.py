@@ -48,7 +48,7 @@ class Objective:
         return f"Objective[{status}](id='{self.id}', type='{self.type}')"
 
 
-@dataclass
+@dataclass(slots=True)
 class Mission:
     """
     Mission with objectives, constraints, and tracking.
@@ -319,7 +319,7 @@ class AuthProfile:
     created_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """
     User-created mission project template.
@@ -389,6 +389,7 @@ class Project:
         obj_type: str = "reach",
         target_id: Optional[str] = None,
         position: Optional[tuple[float, float, float]] = None,
+        now: Optional[datetime] = None,
     ) -> None:
         """
         Add an objective template to the project.
@@ -398,6 +399,8 @@ class Project:
             obj_type: Objective type ("reach", "collect", "maintain", "avoid")
             target_id: Optional target body/ship ID
             position: Optional target position (x, y, z)
+            now: Update timestamp to record (defaults to the current time);
+                pass one value when applying several changes together
         """
         objective = {
             "description": description,
@@ -406,10 +409,13 @@ class Project:
             "position": position,
         }
         self.objectives.append(objective)
-        self.updated_at = datetime.now()
+        self.updated_at = now if now is not None else datetime.now()
 
     def update_metadata(
-        self, name: Optional[str] = None, description: Optional[str] = None
+        self,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        now: Optional[datetime] = None,
     ) -> None:
         """
         Update project metadata.
@@ -417,12 +423,13 @@ class Project:
         Args:
             name: Optional new name
             description: Optional new description
+            now: Update timestamp to record (defaults to the current time)
         """
         if name is not None:
             self.name = name
         if description is not None:
             self.description = description
-        self.updated_at = datetime.now()
+        self.updated_at = now if now is not None else datetime.now()
 
     def __repr__(self) -> str:
         return f"Project(id='{self.id}', name='{self.name}', user_id='{self.user_id}')"
@@ -7,8 +7,11 @@ thrust simulation, and momentum conservation.
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from .types import Vector3D
 
 if TYPE_CHECKING:
@@ -48,9 +51,14 @@ class PhysicsEngine:
         Returns:
             Gravitational force vector in Newtons
         """
-        # Vector from celestial body to spacecraft
-        r = spacecraft.position - celestial_body.position
-        distance = r.magnitude()
+        # Vector from celestial body to spacecraft, as plain floats so no
+        # intermediate Vector3D objects are allocated
+        ship_position = spacecraft.position
+        body_position = celestial_body.position
+        rx = ship_position.x - body_position.x
+        ry = ship_position.y - body_position.y
+        rz = ship_position.z - body_position.z
+        distance = math.hypot(rx, ry, rz)
 
         if distance == 0.0:
             return Vector3D(0.0, 0.0, 0.0)
@@ -63,10 +71,94 @@ class PhysicsEngine:
             / (distance**2)
         )
 
-        # Force direction (toward celestial body)
-        force_direction = -r.normalize()
+        # Force direction is -r / |r| (toward celestial body); dividing each
+        # component first rounds exactly like normalize() followed by scaling
+        scale = -force_magnitude
+        return Vector3D(
+            (rx / distance) * scale, (ry / distance) * scale, (rz / distance) * scale
+        )
+
+    def calculate_gravity_batch(
+        self,
+        ship_positions: np.ndarray,
+        ship_masses: np.ndarray | float,
+        body_positions: np.ndarray,
+        body_masses: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculate gravitational forces for many spacecraft/body pairs at once.
+
+        Row ``i`` of the result is the force body ``i`` exerts on spacecraft
+        ``i``, matching `calculate_gravity` applied pair by pair. Coincident
+        pairs yield a zero force.
+
+        Args:
+            ship_positions: Spacecraft positions in meters, shape (N, 3)
+            ship_masses: Spacecraft masses in kg, shape (N,) or a scalar
+            body_positions: Celestial body positions in meters, shape (N, 3)
+            body_masses: Celestial body masses in kg, shape (N,)
+
+        Returns:
+            Gravitational force vectors in Newtons, shape (N, 3)
+        """
+        r = np.asarray(body_positions, dtype=np.float64) - np.asarray(
+            ship_positions, dtype=np.float64
+        )
+        distance_sq = np.einsum("ij,ij->i", r, r)
+        masses = np.asarray(ship_masses, dtype=np.float64) * np.asarray(
+            body_masses, dtype=np.float64
+        )
 
-        return force_direction * force_magnitude
+        # F = G * M * m / r², applied along r / |r|
+        scale = np.zeros_like(distance_sq)
+        nonzero = distance_sq > 0.0
+        scale[nonzero] = (
+            self.gravitational_constant
+            * np.broadcast_to(masses, distance_sq.shape)[nonzero]
+            / (distance_sq[nonzero] * np.sqrt(distance_sq[nonzero]))
+        )
+        return r * scale[:, np.newaxis]
+
+    def calculate_net_gravity(
+        self,
+        ship_positions: np.ndarray,
+        ship_masses: np.ndarray | float,
+        body_positions: np.ndarray,
+        body_masses: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculate the total gravitational force of many bodies on many spacecraft.
+
+        Every spacecraft interacts with every body, so row ``i`` of the result
+        equals the sum of `calculate_gravity` over all bodies for spacecraft
+        ``i``. Coincident spacecraft/body pairs contribute no force.
+
+        Args:
+            ship_positions: Spacecraft positions in meters, shape (M, 3)
+            ship_masses: Spacecraft masses in kg, shape (M,) or a scalar
+            body_positions: Celestial body positions in meters, shape (N, 3)
+            body_masses: Celestial body masses in kg, shape (N,)
+
+        Returns:
+            Net gravitational force vectors in Newtons, shape (M, 3)
+        """
+        ships = np.asarray(ship_positions, dtype=np.float64)
+        bodies = np.asarray(body_positions, dtype=np.float64)
+        r = bodies[np.newaxis, :, :] - ships[:, np.newaxis, :]
+        distance_sq = np.einsum("mnk,mnk->mn", r, r)
+
+        # G / r³ per pair, zero where a spacecraft sits on a body
+        inv_r3 = np.zeros_like(distance_sq)
+        nonzero = distance_sq > 0.0
+        inv_r3[nonzero] = self.gravitational_constant / (
+            distance_sq[nonzero] * np.sqrt(distance_sq[nonzero])
+        )
+        ship_mass = np.broadcast_to(
+            np.asarray(ship_masses, dtype=np.float64), (len(ships),)
+        )
+        body_mass = np.asarray(body_masses, dtype=np.float64)
+        weights = ship_mass[:, np.newaxis] * body_mass[np.newaxis, :] * inv_r3
+        return np.einsum("mn,mnk->mk", weights, r)
 
     def calculate_acceleration(self, force: Vector3D, mass: float) -> Vector3D:
         """
@@ -6,13 +6,64 @@ Defines planets, moons, and other celestial bodies for navigation.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import math
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+import numpy as np
 
 from .types import Vector3D
 
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# Below this many bodies a KD-tree build costs more than a brute-force scan
+KDTREE_MIN_BODIES = 16
+
+# Bits per axis in a 63-bit Morton (Z-order) code
+_MORTON_BITS = 21
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Insert two zero bits between each of the low 21 bits of `values`."""
+    values = values & np.uint64(0x1FFFFF)
+    values = (values | values << np.uint64(32)) & np.uint64(0x1F00000000FFFF)
+    values = (values | values << np.uint64(16)) & np.uint64(0x1F0000FF0000FF)
+    values = (values | values << np.uint64(8)) & np.uint64(0x100F00F00F00F00F)
+    values = (values | values << np.uint64(4)) & np.uint64(0x10C30C30C30C30C3)
+    values = (values | values << np.uint64(2)) & np.uint64(0x1249249249249249)
+    return values
+
 
-@dataclass
+def _morton_codes(positions: np.ndarray) -> np.ndarray:
+    """
+    Compute Z-order curve codes for positions.
+
+    Each axis is scaled to the bounding box of `positions` and quantized to
+    21 bits before the bits are interleaved.
+
+    Args:
+        positions: Positions, shape (N, 3)
+
+    Returns:
+        Morton codes as uint64, shape (N,)
+    """
+    lower = positions.min(axis=0)
+    span = positions.max(axis=0) - lower
+    span[span == 0.0] = 1.0
+    scale = float((1 << _MORTON_BITS) - 1)
+    cells = ((positions - lower) / span * scale).astype(np.uint64)
+    return (
+        _spread_bits(cells[:, 0])
+        | _spread_bits(cells[:, 1]) << np.uint64(1)
+        | _spread_bits(cells[:, 2]) << np.uint64(2)
+    )
+
+
+@dataclass(slots=True)
 class CelestialBody:
     """
     Planetary body with physical and orbital properties.
@@ -77,24 +128,34 @@ class CelestialBody:
     position: Vector3D = None
     velocity: Vector3D = None
 
+    # Derived from mass, radius and atmosphere depth, which are fixed after
+    # construction
+    _surface_gravity: float = field(default=0.0, init=False, repr=False, compare=False)
+    _atmosphere_radius_sq: float = field(
+        default=0.0, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Initialize position and velocity if not provided."""
         if self.position is None:
             self.position = Vector3D(0.0, 0.0, 0.0)
         if self.velocity is None:
             self.velocity = Vector3D(0.0, 0.0, 0.0)
+        G = 6.67430e-11  # Gravitational constant
+        if self.radius != 0.0:
+            self._surface_gravity = (G * self.mass) / (self.radius**2)
+        self._atmosphere_radius_sq = (self.radius + self.atmosphere_depth) ** 2
 
     def get_surface_gravity(self) -> float:
         """
-        Calculate surface gravity in m/s².
+        Get surface gravity in m/s².
+
+        The value is computed once at construction from `mass` and `radius`.
 
         Returns:
             Surface gravity acceleration in m/s²
         """
-        G = 6.67430e-11  # Gravitational constant
-        if self.radius == 0.0:
-            return 0.0
-        return (G * self.mass) / (self.radius**2)
+        return self._surface_gravity
 
     def is_in_atmosphere(self, position: Vector3D) -> bool:
         """
@@ -108,8 +169,11 @@ class CelestialBody:
         """
         if not self.has_atmosphere:
             return False
-        distance = (position - self.position).magnitude()
-        return distance <= (self.radius + self.atmosphere_depth)
+        # Compare squared distances so no square root is needed
+        dx = position.x - self.position.x
+        dy = position.y - self.position.y
+        dz = position.z - self.position.z
+        return dx * dx + dy * dy + dz * dz <= self._atmosphere_radius_sq
 
     def get_distance_to_surface(self, position: Vector3D) -> float:
         """
@@ -121,7 +185,11 @@ class CelestialBody:
         Returns:
             Distance in meters (negative if below surface)
         """
-        distance = (position - self.position).magnitude()
+        distance = math.hypot(
+            position.x - self.position.x,
+            position.y - self.position.y,
+            position.z - self.position.z,
+        )
         return distance - self.radius
 
     def __repr__(self) -> str:
@@ -135,8 +203,17 @@ class SolarSystem:
     Manages the collection of planets, moons, and other astronomical objects
     in the simulation. Provides lookup and iteration capabilities.
 
+    Bodies are stored in a list, with a map from body ID to list index. The
+    list keeps insertion order until `sort_by_morton` reorders it. Row ``i``
+    of every cached array belongs to body ``i``; body positions are kept in
+    an (N, 3) array for vectorized spatial queries. Each query re-reads the
+    bodies' positions into that array first, so moving a body needs no
+    extra call. When SciPy is installed and the system holds at least
+    `KDTREE_MIN_BODIES` bodies, nearest-body lookups go through a KD-tree
+    built lazily from that array and rebuilt only after bodies move.
+
     Attributes:
-        bodies: Dictionary mapping body IDs to CelestialBody instances
+        bodies: Read-only mapping of body IDs to CelestialBody instances
         sun: Reference to the Sun
 
     Examples:
@@ -147,10 +224,38 @@ class SolarSystem:
 
     def __init__(self) -> None:
         """Initialize empty solar system."""
-        self.bodies: dict[str, CelestialBody] = {}
         self.sun: Optional[CelestialBody] = None
+        self._bodies_by_id: dict[str, CelestialBody] = {}
+        self._bodies_view = MappingProxyType(self._bodies_by_id)
+        self._reset_bodies()
         self._initialize_system()
 
+    def _reset_bodies(self) -> None:
+        """Drop every body and its cached arrays."""
+        self._bodies: list[CelestialBody] = []
+        # Cleared in place so the proxy returned by `bodies` stays valid
+        self._bodies_by_id.clear()
+        self._body_rows: dict[str, int] = {}
+        self._positions: np.ndarray = np.empty((0, 3), dtype=np.float64)
+        self._masses: np.ndarray = np.empty(0, dtype=np.float64)
+        self._atmosphere_radii: np.ndarray = np.empty(0, dtype=np.float64)
+        self._kdtree = None
+        self._kdtree_dirty = True
+
+    @property
+    def bodies(self) -> Mapping[str, CelestialBody]:
+        """Live read-only mapping of body IDs to bodies, in storage order."""
+        return self._bodies_view
+
+    @bodies.setter
+    def bodies(self, bodies: Mapping[str, CelestialBody]) -> None:
+        """Replace every body in the system."""
+        # Copied first: `bodies` may be this system's own live view
+        new_bodies = list(bodies.values())
+        self._reset_bodies()
+        for body in new_bodies:
+            self.add_body(body)
+
     def _initialize_system(self) -> None:
         """Initialize the solar system with basic celestial bodies."""
         # Sun
@@ -166,7 +271,7 @@ class SolarSystem:
             has_atmosphere=False,
             has_water=False,
         )
-        self.bodies["sun"] = self.sun
+        self.add_body(self.sun)
 
         # TODO: Add planets, moons, asteroids
 
@@ -174,10 +279,88 @@ class SolarSystem:
         """
         Add a celestial body to the system.
 
+        Re-adding a body also refreshes its cached mass, radius and
+        atmosphere.
+
         Args:
             body: CelestialBody to add
         """
-        self.bodies[body.id] = body
+        self._kdtree_dirty = True
+        # Bodies without an atmosphere can never contain a position
+        atmosphere_radius = (
+            body.radius + body.atmosphere_depth if body.has_atmosphere else -np.inf
+        )
+        self._bodies_by_id[body.id] = body
+        row = self._body_rows.get(body.id)
+        if row is not None:
+            self._bodies[row] = body
+            self._positions[row] = body.position.to_array()
+            self._masses[row] = body.mass
+            self._atmosphere_radii[row] = atmosphere_radius
+            return
+        self._body_rows[body.id] = len(self._bodies)
+        self._bodies.append(body)
+        self._positions = np.vstack((self._positions, body.position.to_array()))
+        self._masses = np.append(self._masses, body.mass)
+        self._atmosphere_radii = np.append(self._atmosphere_radii, atmosphere_radius)
+
+    def update_positions(self) -> None:
+        """
+        Refresh the cached position array from the bodies' positions.
+
+        Every spatial query calls this first, so moved bodies are always
+        seen. The KD-tree is only rebuilt when a position actually changed.
+        """
+        positions = np.fromiter(
+            (
+                coordinate
+                for body in self._bodies
+                for coordinate in (body.position.x, body.position.y, body.position.z)
+            ),
+            dtype=np.float64,
+            count=3 * len(self._bodies),
+        ).reshape(-1, 3)
+        if not np.array_equal(positions, self._positions):
+            self._positions[:] = positions
+            self._kdtree_dirty = True
+
+    def sort_by_morton(self) -> None:
+        """
+        Reorder bodies along a Z-order (Morton) curve of their positions.
+
+        Spatially close bodies end up in neighboring rows, so scans over the
+        cached arrays touch memory in spatial order. This changes the order of
+        `bodies` and of query results; call it once after adding a batch of
+        bodies rather than after every `add_body`.
+        """
+        if len(self._bodies) < 2:
+            return
+        self.update_positions()
+        order = np.argsort(_morton_codes(self._positions), kind="stable")
+        self._bodies = [self._bodies[row] for row in order]
+        self._body_rows = {body.id: row for row, body in enumerate(self._bodies)}
+        # Rebuilt in place so the proxy returned by `bodies` stays valid
+        self._bodies_by_id.clear()
+        self._bodies_by_id.update((body.id, body) for body in self._bodies)
+        self._positions = self._positions[order]
+        self._masses = self._masses[order]
+        self._atmosphere_radii = self._atmosphere_radii[order]
+        self._kdtree_dirty = True
+
+    @property
+    def position_array(self) -> np.ndarray:
+        """Read-only (N, 3) view of the current body positions in meters."""
+        self.update_positions()
+        view = self._positions.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def mass_array(self) -> np.ndarray:
+        """Read-only (N,) view of the body masses in kg, in position order."""
+        view = self._masses.view()
+        view.flags.writeable = False
+        return view
 
     def get_body(self, body_id: str) -> Optional[CelestialBody]:
         """
@@ -189,7 +372,7 @@ class SolarSystem:
         Returns:
             CelestialBody or None if not found
         """
-        return self.bodies.get(body_id)
+        return self._bodies_by_id.get(body_id)
 
     def get_nearest_body(self, position: Vector3D) -> Optional[CelestialBody]:
         """
@@ -201,19 +384,104 @@ class SolarSystem:
         Returns:
             Nearest CelestialBody or None if no bodies
         """
-        if not self.bodies:
+        if not self._bodies:
             return None
 
-        nearest = None
-        min_distance = float("inf")
+        self.update_positions()
+        tree = self._tree()
+        if tree is not None:
+            _, row = tree.query(position.to_array(), k=1)
+            return self._bodies[int(row)]
+
+        diff = self._positions - position.to_array()
+        distances_sq = np.einsum("ij,ij->i", diff, diff)
+        return self._bodies[int(distances_sq.argmin())]
+
+    def bodies_containing(self, position: Vector3D) -> list[CelestialBody]:
+        """
+        Find every body whose atmosphere contains a position.
+
+        Bulk equivalent of calling `CelestialBody.is_in_atmosphere` on each
+        body. With a KD-tree available, only bodies within the largest
+        atmosphere radius are checked.
 
-        for body in self.bodies.values():
-            distance = (position - body.position).magnitude()
-            if distance < min_distance:
-                min_distance = distance
-                nearest = body
+        Args:
+            position: Position to check
 
-        return nearest
+        Returns:
+            Bodies containing the position, in storage order
+        """
+        if not self._bodies:
+            return []
+        max_radius = self._atmosphere_radii.max()
+        if max_radius < 0.0:
+            return []
+
+        self.update_positions()
+        point = position.to_array()
+        tree = self._tree()
+        if tree is not None:
+            rows = np.sort(
+                np.asarray(tree.query_ball_point(point, r=max_radius), dtype=np.intp)
+            )
+        else:
+            rows = np.arange(len(self._bodies))
+        diff = self._positions[rows] - point
+        distances_sq = np.einsum("ij,ij->i", diff, diff)
+        radii = self._atmosphere_radii[rows]
+        inside = rows[(radii >= 0.0) & (distances_sq <= radii * radii)]
+        return [self._bodies[row] for row in inside]
+
+    def bodies_in_cone(
+        self,
+        origin: Vector3D,
+        direction: Vector3D,
+        half_angle: float,
+        max_distance: Optional[float] = None,
+    ) -> list[CelestialBody]:
+        """
+        Find bodies whose centers lie within a cone.
+
+        Args:
+            origin: Cone apex, e.g. a spacecraft position
+            direction: Cone axis (need not be normalized)
+            half_angle: Cone half-angle in radians
+            max_distance: Optional cap on the distance from the apex
+
+        Returns:
+            Bodies inside the cone, in storage order
+
+        Raises:
+            ValueError: If direction is the zero vector
+        """
+        axis = direction.normalize()
+        if axis.magnitude() == 0.0:
+            raise ValueError("Cone direction must be non-zero")
+        if not self._bodies:
+            return []
+
+        self.update_positions()
+        diff = self._positions - origin.to_array()
+        distances = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+        along_axis = diff @ axis.to_array()
+        inside = (distances > 0.0) & (along_axis >= distances * math.cos(half_angle))
+        if max_distance is not None:
+            inside &= distances <= max_distance
+        return [self._bodies[row] for row in np.flatnonzero(inside)]
+
+    def _tree(self) -> Optional[cKDTree]:
+        """
+        Return the KD-tree over body positions, rebuilding it if stale.
+
+        Returns:
+            cKDTree, or None when SciPy is missing or the system is too small
+        """
+        if cKDTree is None or len(self._bodies) < KDTREE_MIN_BODIES:
+            return None
+        if self._kdtree_dirty:
+            self._kdtree = cKDTree(self._positions)
+            self._kdtree_dirty = False
+        return self._kdtree
 
     def __repr__(self) -> str:
-        return f"SolarSystem(bodies={len(self.bodies)})"
+        return f"SolarSystem(bodies={len(self._bodies)})"
@@ -10,8 +10,11 @@ from dataclasses import dataclass, field
 
 from .types import Quaternion, Vector3D
 
+# Indexed by how many oxygen thresholds (50%, 20%) have been reached
+_LIFE_SUPPORT_STATUSES = ("nominal", "warning", "critical")
 
-@dataclass
+
+@dataclass(slots=True)
 class Spacecraft:
     """
     Spacecraft with physical properties and operational state.
@@ -158,13 +161,10 @@ class Spacecraft:
         oxygen_consumption = 0.1 * delta_time  # 0.1% per second
         self.oxygen_level = max(0.0, self.oxygen_level - oxygen_consumption)
 
-        # Update status based on oxygen level
-        if self.oxygen_level > 50.0:
-            self.life_support_status = "nominal"
-        elif self.oxygen_level > 20.0:
-            self.life_support_status = "warning"
-        else:
-            self.life_support_status = "critical"
+        # Update status based on oxygen level: above 50% nominal, above 20%
+        # warning, otherwise critical
+        severity = (self.oxygen_level <= 50.0) + (self.oxygen_level <= 20.0)
+        self.life_support_status = _LIFE_SUPPORT_STATUSES[severity]
 
     def set_throttle(self, percentage: float) -> None:
         """
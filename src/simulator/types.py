@@ -10,8 +10,10 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Vector3D:
     """
     3D vector for position, velocity, and acceleration.
@@ -36,7 +38,7 @@ class Vector3D:
 
     def magnitude(self) -> float:
         """Calculate vector magnitude (length)."""
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+        return math.hypot(self.x, self.y, self.z)
 
     def normalize(self) -> Vector3D:
         """Return normalized vector (unit length)."""
@@ -77,11 +79,51 @@ class Vector3D:
         """Negate vector."""
         return Vector3D(-self.x, -self.y, -self.z)
 
+    def to_array(self) -> np.ndarray:
+        """Return components as a float64 array of shape (3,)."""
+        return np.array((self.x, self.y, self.z), dtype=np.float64)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> Vector3D:
+        """
+        Create a vector from a length-3 array.
+
+        Args:
+            values: Array-like with x, y, z components
+
+        Returns:
+            Vector3D with the given components
+        """
+        x, y, z = np.asarray(values, dtype=np.float64)
+        return cls(float(x), float(y), float(z))
+
+    @staticmethod
+    def normalize_batch(vectors: np.ndarray) -> np.ndarray:
+        """
+        Normalize many vectors at once.
+
+        Rows with zero length stay zero, matching `normalize`. The
+        reciprocal is only computed for non-zero rows, so no division
+        warnings are raised.
+
+        Args:
+            vectors: Array of vectors, shape (N, 3)
+
+        Returns:
+            Unit vectors, shape (N, 3)
+        """
+        vectors = np.asarray(vectors, dtype=np.float64)
+        magnitudes = np.linalg.norm(vectors, axis=1, keepdims=True)
+        inverse = np.divide(
+            1.0, magnitudes, out=np.zeros_like(magnitudes), where=magnitudes > 0.0
+        )
+        return vectors * inverse
+
     def __repr__(self) -> str:
         return f"Vector3D(x={self.x:.2f}, y={self.y:.2f}, z={self.z:.2f})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Quaternion:
     """
     Quaternion for 3D rotation (orientation).
@@ -149,9 +191,63 @@ class Quaternion:
             z=sy * cp * cr - cy * sp * sr,
         )
 
+    @staticmethod
+    def from_euler_batch(
+        pitch: np.ndarray, yaw: np.ndarray, roll: np.ndarray
+    ) -> np.ndarray:
+        """
+        Create many quaternions from Euler angles at once.
+
+        Args:
+            pitch: Pitch angles in radians, shape (N,)
+            yaw: Yaw angles in radians, shape (N,)
+            roll: Roll angles in radians, shape (N,)
+
+        Returns:
+            Quaternions as (w, x, y, z) rows, shape (N, 4)
+        """
+        half_yaw = np.asarray(yaw, dtype=np.float64) * 0.5
+        half_pitch = np.asarray(pitch, dtype=np.float64) * 0.5
+        half_roll = np.asarray(roll, dtype=np.float64) * 0.5
+        cy, sy = np.cos(half_yaw), np.sin(half_yaw)
+        cp, sp = np.cos(half_pitch), np.sin(half_pitch)
+        cr, sr = np.cos(half_roll), np.sin(half_roll)
+
+        return np.stack(
+            (
+                cy * cp * cr + sy * sp * sr,
+                cy * cp * sr - sy * sp * cr,
+                sy * cp * sr + cy * sp * cr,
+                sy * cp * cr - cy * sp * sr,
+            ),
+            axis=-1,
+        )
+
+    @staticmethod
+    def to_euler_batch(
+        quaternions: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert many quaternions to Euler angles at once.
+
+        The pitch sine is clipped to [-1, 1] so rounding error on unit
+        quaternions cannot produce NaN.
+
+        Args:
+            quaternions: Quaternions as (w, x, y, z) rows, shape (N, 4)
+
+        Returns:
+            Tuple of (pitch, yaw, roll) arrays in radians, each shape (N,)
+        """
+        w, x, y, z = np.asarray(quaternions, dtype=np.float64).T
+        pitch = np.arcsin(np.clip(2 * (w * y - z * x), -1.0, 1.0))
+        yaw = np.arctan2(2 * (w * z + x * y), 1 - 2 * (y**2 + z**2))
+        roll = np.arctan2(2 * (w * x + y * z), 1 - 2 * (x**2 + y**2))
+        return pitch, yaw, roll
+
     def normalize(self) -> Quaternion:
         """Normalize quaternion to unit length."""
-        mag = math.sqrt(self.w**2 + self.x**2 + self.y**2 + self.z**2)
+        mag = math.hypot(self.w, self.x, self.y, self.z)
         if mag == 0.0:
             return Quaternion(1.0, 0.0, 0.0, 0.0)
         return Quaternion(self.w / mag, self.x / mag, self.y / mag, self.z / mag)
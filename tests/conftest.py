@@ -0,0 +1,133 @@
+"""
+Shared pytest fixtures.
+
+Fixtures defined here are available to every test module.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from src.api.app import ALGORITHM, SECRET_KEY, create_app
+from src.cockpit.auth import AuthService
+from src.cockpit.memory import InMemoryAuthRepository, InMemoryUserRepository
+from src.cockpit.services import UserService
+from src.models import Mission
+from src.simulator.types import Vector3D
+
+SESSION_USER = {
+    "username": "testuser",
+    "email": "test@example.com",
+    "password": "TestPassword123",
+    "display_name": "Test User",
+}
+
+
+def _create_test_token(
+    user_id: str, username: str, expires_in_minutes: int = 60
+) -> str:
+    """Helper to create a JWT token for testing."""
+    expire = datetime.now(tz=timezone.utc) + timedelta(minutes=expires_in_minutes)
+    payload = {
+        "sub": user_id,
+        "username": username,
+        "exp": int(expire.timestamp()),
+        "iat": int(datetime.now(tz=timezone.utc).timestamp()),
+    }
+    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+
+
+@pytest.fixture(scope="session")
+def create_token() -> Callable[..., str]:
+    """Expose the JWT helper to test modules."""
+    return _create_test_token
+
+
+def _assert_vec_close(
+    vector: Vector3D, expected: tuple[float, float, float], atol: float = 1e-10
+) -> None:
+    """Assert all three components of a vector match within `atol`."""
+    np.testing.assert_allclose(
+        (vector.x, vector.y, vector.z), expected, rtol=0.0, atol=atol
+    )
+
+
+@pytest.fixture(scope="session")
+def assert_vec_close() -> Callable[..., None]:
+    """Expose the vector comparison helper to test modules."""
+    return _assert_vec_close
+
+
+@pytest.fixture
+def basic_mission() -> Mission:
+    """Fresh not-started tutorial mission with no objectives."""
+    return Mission(
+        id="m1",
+        name="Test",
+        type="tutorial",
+        difficulty="beginner",
+        description="Test",
+    )
+
+
+@pytest.fixture(scope="session")
+def session_repositories() -> SimpleNamespace:
+    """In-memory user and auth repositories shared across the session."""
+    return SimpleNamespace(
+        users=InMemoryUserRepository(), auth=InMemoryAuthRepository()
+    )
+
+
+@pytest.fixture(scope="session")
+def session_client(session_repositories: SimpleNamespace) -> TestClient:
+    """Create a test client that lives for the whole session."""
+    service = AuthService(
+        UserService(session_repositories.users), session_repositories.auth
+    )
+    return TestClient(create_app(auth_service=service))
+
+
+@pytest.fixture(scope="session")
+def authed(session_client: TestClient) -> SimpleNamespace:
+    """
+    Register the session user once and expose an authenticated baseline.
+
+    Returns:
+        Namespace with `client`, `payload`, `user` (registration response)
+        and `token` (valid JWT for the user)
+    """
+    response = session_client.post("/register", json=SESSION_USER)
+    assert response.status_code == 201, response.text
+    user = response.json()
+    token = _create_test_token(user["user_id"], user["username"])
+    return SimpleNamespace(
+        client=session_client, payload=SESSION_USER, user=user, token=token
+    )
+
+
+@pytest.fixture
+def authed_client(
+    authed: SimpleNamespace, session_repositories: SimpleNamespace
+) -> Iterator[TestClient]:
+    """
+    Yield the session client and clear other users after the test.
+
+    The session user is preserved so later tests can keep using `authed`.
+    """
+    user_id = authed.user["user_id"]
+    user = session_repositories.users.get_user(user_id)
+    profile = session_repositories.auth.get_by_user_id(user_id)
+
+    yield authed.client
+
+    session_repositories.users.clear()
+    session_repositories.auth.clear()
+    session_repositories.users.save_user(user)
+    session_repositories.auth.save_profile(profile)
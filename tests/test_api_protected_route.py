@@ -4,62 +4,24 @@ Tests for protected routes requiring authentication.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
-import pytest
 from fastapi.testclient import TestClient
 from jose import jwt
 
-from src.api.app import ALGORITHM, SECRET_KEY, create_app
+from src.api.app import ALGORITHM, SECRET_KEY
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create a test client with in-memory repositories."""
-    app = create_app()
-    return TestClient(app)
-
-
-@pytest.fixture
-def registered_user(client: TestClient) -> dict:
-    """Register a test user and return user data."""
-    response = client.post(
-        "/register",
-        json={
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "TestPassword123",
-            "display_name": "Test User",
-        },
-    )
-    assert response.status_code == 201
-    return response.json()
-
-
-def _create_test_token(
-    user_id: str, username: str, expires_in_minutes: int = 60
-) -> str:
-    """Helper to create a JWT token for testing."""
-    expire = datetime.now(tz=timezone.utc) + timedelta(minutes=expires_in_minutes)
-    payload = {
-        "sub": user_id,
-        "username": username,
-        "exp": int(expire.timestamp()),
-        "iat": int(datetime.now(tz=timezone.utc).timestamp()),
-    }
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
-
-
-def test_get_me_with_valid_token(client: TestClient, registered_user: dict) -> None:
+def test_get_me_with_valid_token(authed: SimpleNamespace) -> None:
     """Test accessing /me with a valid JWT token."""
-    user_id = registered_user["user_id"]
-    username = registered_user["username"]
+    user_id = authed.user["user_id"]
+    username = authed.user["username"]
 
-    token = _create_test_token(user_id, username)
-
-    response = client.get(
+    response = authed.client.get(
         "/me",
-        headers={"Authorization": f"Bearer {token}"},
+        headers={"Authorization": f"Bearer {authed.token}"},
     )
 
     assert response.status_code == 200
@@ -71,9 +33,9 @@ def test_get_me_with_valid_token(client: TestClient, registered_user: dict) -> N
     assert "created_at" in data
 
 
-def test_get_me_without_token(client: TestClient) -> None:
+def test_get_me_without_token(authed_client: TestClient) -> None:
     """Test accessing /me without a token should return 403."""
-    response = client.get("/me")
+    response = authed_client.get("/me")
 
     assert response.status_code == 403
     # FastAPI HTTPBearer returns 403 with detail for missing token
@@ -81,9 +43,9 @@ def test_get_me_without_token(client: TestClient) -> None:
     assert "detail" in data or "error" in data
 
 
-def test_get_me_with_invalid_token(client: TestClient) -> None:
+def test_get_me_with_invalid_token(authed_client: TestClient) -> None:
     """Test accessing /me with an invalid token should return 401."""
-    response = client.get(
+    response = authed_client.get(
         "/me",
         headers={"Authorization": "Bearer invalid_token_here"},
     )
@@ -94,10 +56,10 @@ def test_get_me_with_invalid_token(client: TestClient) -> None:
     assert "Invalid or expired token" in data["error"]["message"]
 
 
-def test_get_me_with_expired_token(client: TestClient, registered_user: dict) -> None:
+def test_get_me_with_expired_token(authed: SimpleNamespace) -> None:
     """Test accessing /me with an expired token should return 401."""
-    user_id = registered_user["user_id"]
-    username = registered_user["username"]
+    user_id = authed.user["user_id"]
+    username = authed.user["username"]
 
     # Create an expired token (expired 1 minute ago)
     expire = datetime.now(tz=timezone.utc) - timedelta(minutes=1)
@@ -109,7 +71,7 @@ def test_get_me_with_expired_token(client: TestClient, registered_user: dict) ->
     }
     expired_token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
-    response = client.get(
+    response = authed.client.get(
         "/me",
         headers={"Authorization": f"Bearer {expired_token}"},
     )
@@ -120,7 +82,7 @@ def test_get_me_with_expired_token(client: TestClient, registered_user: dict) ->
     assert "Invalid or expired token" in data["error"]["message"]
 
 
-def test_get_me_with_token_missing_sub(client: TestClient) -> None:
+def test_get_me_with_token_missing_sub(authed_client: TestClient) -> None:
     """Test accessing /me with a token missing 'sub' claim should return 401."""
     payload = {
         "username": "testuser",
@@ -129,7 +91,7 @@ def test_get_me_with_token_missing_sub(client: TestClient) -> None:
     }
     token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
-    response = client.get(
+    response = authed_client.get(
         "/me",
         headers={"Authorization": f"Bearer {token}"},
     )
@@ -140,11 +102,13 @@ def test_get_me_with_token_missing_sub(client: TestClient) -> None:
     assert "Invalid authentication credentials" in data["error"]["message"]
 
 
-def test_get_me_with_nonexistent_user(client: TestClient) -> None:
+def test_get_me_with_nonexistent_user(
+    authed_client: TestClient, create_token: Callable[..., str]
+) -> None:
     """Test accessing /me with a token for a non-existent user should return 401."""
-    token = _create_test_token("nonexistent-user-id", "nonexistent")
+    token = create_token("nonexistent-user-id", "nonexistent")
 
-    response = client.get(
+    response = authed_client.get(
         "/me",
         headers={"Authorization": f"Bearer {token}"},
     )
@@ -155,12 +119,10 @@ def test_get_me_with_nonexistent_user(client: TestClient) -> None:
     assert "User not found" in data["error"]["message"]
 
 
-def test_get_me_with_wrong_secret_key(
-    client: TestClient, registered_user: dict
-) -> None:
+def test_get_me_with_wrong_secret_key(authed: SimpleNamespace) -> None:
     """Test accessing /me with a token signed with wrong secret should return 401."""
-    user_id = registered_user["user_id"]
-    username = registered_user["username"]
+    user_id = authed.user["user_id"]
+    username = authed.user["username"]
 
     # Create token with wrong secret
     expire = datetime.now(tz=timezone.utc) + timedelta(minutes=60)
@@ -172,7 +134,7 @@ def test_get_me_with_wrong_secret_key(
     }
     wrong_token = jwt.encode(payload, "wrong-secret-key", algorithm=ALGORITHM)
 
-    response = client.get(
+    response = authed.client.get(
         "/me",
         headers={"Authorization": f"Bearer {wrong_token}"},
     )
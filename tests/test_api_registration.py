@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from types import SimpleNamespace
+
+import pytest
 from fastapi.testclient import TestClient
 
 from src.api.app import create_app
@@ -8,34 +12,41 @@ from src.cockpit.memory import InMemoryAuthRepository, InMemoryUserRepository
 from src.cockpit.services import UserService
 
 
-def build_test_client() -> TestClient:
-    user_repo = InMemoryUserRepository()
-    auth_repo = InMemoryAuthRepository()
-    service = AuthService(UserService(user_repo), auth_repo)
-    app = create_app(auth_service=service)
-    return TestClient(app)
+@pytest.fixture(scope="module")
+def repositories() -> SimpleNamespace:
+    """In-memory repositories shared by the module's client."""
+    return SimpleNamespace(
+        users=InMemoryUserRepository(), auth=InMemoryAuthRepository()
+    )
 
 
-def test_register_success() -> None:
-    client = build_test_client()
-    payload = {
-        "username": "astro_cadet",
-        "email": "astro_cadet@example.com",
-        "password": "StrongPass1",
-        "display_name": "Astro Cadet",
-    }
+@pytest.fixture(scope="module")
+def module_client(repositories: SimpleNamespace) -> TestClient:
+    """Build one test client for the whole module."""
+    service = AuthService(UserService(repositories.users), repositories.auth)
+    return TestClient(create_app(auth_service=service))
 
-    response = client.post("/register", json=payload)
-    assert response.status_code == 201
-    data = response.json()
+
+@pytest.fixture
+def client(
+    module_client: TestClient, repositories: SimpleNamespace
+) -> Iterator[TestClient]:
+    """Yield the module client and reset stored users after each test."""
+    yield module_client
+    repositories.users.clear()
+    repositories.auth.clear()
+
+
+def test_register_success(authed: SimpleNamespace) -> None:
+    payload = authed.payload
+    data = authed.user
     assert data["username"] == payload["username"]
     assert data["email"] == payload["email"]
     assert data["display_name"] == payload["display_name"]
     assert "user_id" in data
 
 
-def test_register_duplicate_username() -> None:
-    client = build_test_client()
+def test_register_duplicate_username(client: TestClient) -> None:
     payload = {
         "username": "mission_ctrl",
         "email": "mission1@example.com",
@@ -55,8 +66,7 @@ def test_register_duplicate_username() -> None:
     )
 
 
-def test_register_weak_password() -> None:
-    client = build_test_client()
+def test_register_weak_password(client: TestClient) -> None:
     payload = {
         "username": "weakling",
         "email": "weakling@example.com",
@@ -74,11 +84,9 @@ def test_register_weak_password() -> None:
     )
 
 
-def test_register_value_error_from_user_service() -> None:
+def test_register_value_error_from_user_service(client: TestClient) -> None:
     """Test that ValueError from UserService is caught and returns 400."""
     # This tests the ValueError exception handler in app.py
-    client = build_test_client()
-
     # First registration succeeds
     payload1 = {
         "username": "testuser",
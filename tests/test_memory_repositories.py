@@ -4,8 +4,13 @@ Tests for in-memory repository implementations.
 
 from __future__ import annotations
 
-from src.cockpit.memory import InMemoryAuthRepository, InMemoryUserRepository
-from src.models import AuthProfile, User
+from src.cockpit.memory import (
+    InMemoryAuthRepository,
+    InMemoryMissionRepository,
+    InMemoryProjectRepository,
+    InMemoryUserRepository,
+)
+from src.models import AuthProfile, Mission, Project, User
 
 
 class TestInMemoryUserRepository:
@@ -55,6 +60,33 @@ class TestInMemoryUserRepository:
 
         assert repo.get_user("user-1") is None
 
+    def test_lookup_by_username_and_email_after_rename(self) -> None:
+        """Test username/email lookups follow a re-saved user."""
+        repo = InMemoryUserRepository()
+        user = User(
+            id="user-1",
+            username="user1",
+            email="user1@example.com",
+            display_name="User 1",
+        )
+        repo.save_user(user)
+
+        user.username = "renamed"
+        user.email = "renamed@example.com"
+        repo.save_user(user)
+
+        assert repo.get_user_by_username("user1") is None
+        assert repo.get_user_by_email("user1@example.com") is None
+        renamed = repo.get_user_by_username("renamed")
+        assert renamed is not None
+        assert renamed.id == "user-1"
+        assert repo.get_user_by_email("renamed@example.com") == renamed
+
+        repo.delete_user("user-1")
+
+        assert repo.get_user_by_username("renamed") is None
+        assert repo.get_user_by_email("renamed@example.com") is None
+
     def test_delete_user_nonexistent(self) -> None:
         """Test deleting a non-existent user doesn't raise error."""
         repo = InMemoryUserRepository()
@@ -108,3 +140,118 @@ class TestInMemoryAuthRepository:
 
         result = repo.get_by_email("nonexistent@example.com")
         assert result is None
+
+
+class TestInMemoryProjectRepository:
+    """Tests for InMemoryProjectRepository."""
+
+    def test_list_projects_follows_updates_and_deletes(self) -> None:
+        """Test filtered listings track re-saved and deleted projects."""
+        repo = InMemoryProjectRepository()
+        project = Project(
+            id="proj-1",
+            user_id="user-1",
+            name="Project",
+            description="Test",
+            mission_type="tutorial",
+            difficulty="beginner",
+        )
+        repo.save_project(project)
+        repo.save_project(
+            Project(
+                id="proj-2",
+                user_id="user-2",
+                name="Other",
+                description="Test",
+                mission_type="challenge",
+                difficulty="beginner",
+                is_public=True,
+            )
+        )
+
+        assert [p.id for p in repo.list_projects(user_id="user-1")] == ["proj-1"]
+        assert repo.list_projects(user_id="user-1", is_public=True) == []
+
+        project.is_public = True
+        repo.save_project(project)
+
+        public_ids = [p.id for p in repo.list_projects(is_public=True)]
+        assert public_ids == ["proj-1", "proj-2"]
+        assert public_ids == [p.id for p in repo.list_projects()]
+        assert repo.list_projects(is_public=False) == []
+
+        repo.delete_project("proj-2")
+
+        assert [p.id for p in repo.list_projects(is_public=True)] == ["proj-1"]
+        assert repo.list_projects(mission_type="challenge") == []
+
+        repo.clear()
+
+        assert repo.list_projects() == []
+        assert repo.list_projects(user_id="user-1") == []
+
+
+class TestInMemoryMissionRepository:
+    """Tests for InMemoryMissionRepository."""
+
+    def test_list_missions_follows_in_place_updates(self) -> None:
+        """Test a mission mutated in place and re-saved moves buckets."""
+        repo = InMemoryMissionRepository()
+        mission = Mission(
+            id="m1",
+            name="Test",
+            type="tutorial",
+            difficulty="beginner",
+            description="Test",
+        )
+        repo.save_mission(mission)
+
+        mission.status = "completed"
+        repo.save_mission(mission)
+
+        assert repo.list_missions(status="not_started") == []
+        completed = repo.list_missions(status="completed", mission_type="tutorial")
+        assert [m.id for m in completed] == ["m1"]
+
+        repo.delete_mission("m1")
+
+        assert repo.list_missions(status="completed") == []
+        assert repo.list_missions() == []
+
+    def test_save_mission_copies_the_instance(self) -> None:
+        """Test mutating a saved mission does not change storage."""
+        repo = InMemoryMissionRepository()
+        mission = Mission(
+            id="m1",
+            name="Test",
+            type="tutorial",
+            difficulty="beginner",
+            description="Test",
+        )
+        repo.save_mission(mission)
+
+        mission.start()
+
+        stored = repo.get_mission("m1")
+        assert stored is not None
+        assert stored.status == "not_started"
+        assert [m.id for m in repo.list_missions(status="not_started")] == ["m1"]
+        assert repo.list_missions(status="in_progress") == []
+
+    def test_bulk_load(self) -> None:
+        """Test bulk-loaded missions are stored and indexed."""
+        repo = InMemoryMissionRepository()
+        repo.bulk_load(
+            Mission(
+                id=f"m{index}",
+                name="Test",
+                type=mission_type,
+                difficulty="beginner",
+                description="Test",
+            )
+            for index, mission_type in enumerate(["tutorial", "challenge", "tutorial"])
+        )
+
+        assert len(repo.list_missions()) == 3
+        tutorials = repo.list_missions(mission_type="tutorial")
+        assert [m.id for m in tutorials] == ["m0", "m2"]
@@ -6,20 +6,63 @@ Unit tests for User, Mission, and Objective models.
 
 from __future__ import annotations
 
+import dataclasses
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
 from src.models import Mission, Objective, User
 
 
+@pytest.fixture(scope="module")
+def make_user() -> Callable[..., User]:
+    """Build a User from default fields, applying keyword overrides."""
+
+    def _make_user(**overrides: Any) -> User:
+        fields = {
+            "id": "u1",
+            "username": "test",
+            "email": "test@example.com",
+            "display_name": "Test",
+        }
+        return User(**(fields | overrides))
+
+    return _make_user
+
+
+@pytest.fixture(scope="module")
+def new_user(make_user: Callable[..., User]) -> User:
+    """Unmodified User shared by read-only tests."""
+    return make_user(id="user-001", username="testuser", display_name="Test User")
+
+
+@pytest.fixture(scope="module")
+def new_mission() -> Mission:
+    """Unmodified Mission shared by read-only tests."""
+    return Mission(
+        id="mission-001",
+        name="Test Mission",
+        type="tutorial",
+        difficulty="beginner",
+        description="A test mission",
+    )
+
+
+@pytest.fixture(scope="module")
+def new_objective() -> Objective:
+    """Unmodified Objective shared by read-only tests."""
+    return Objective(
+        id="obj-001", description="Reach Mars orbit", type="reach", target_id="mars"
+    )
+
+
 class TestUser:
     """Test cases for User model."""
 
-    def test_user_initialization(self):
+    def test_user_initialization(self, new_user: User):
         """Test that User initializes correctly."""
-        user = User(
-            id="user-001",
-            username="testuser",
-            email="test@example.com",
-            display_name="Test User",
-        )
+        user = new_user
 
         assert user.id == "user-001"
         assert user.username == "testuser"
@@ -28,11 +71,9 @@ class TestUser:
         assert user.total_flight_time == 0.0
         assert user.missions_completed == 0
 
-    def test_update_statistics(self):
+    def test_update_statistics(self, make_user: Callable[..., User]):
         """Test statistics update."""
-        user = User(
-            id="u1", username="test", email="test@example.com", display_name="Test"
-        )
+        user = make_user()
 
         user.update_statistics(
             flight_time=1.5, distance=5000.0, fuel=100.0, ship_type="scout"
@@ -43,11 +84,9 @@ class TestUser:
         assert user.fuel_consumed == 100.0
         assert "scout" in user.ship_types_used
 
-    def test_add_completed_mission(self):
+    def test_add_completed_mission(self, make_user: Callable[..., User]):
         """Test adding completed mission."""
-        user = User(
-            id="u1", username="test", email="test@example.com", display_name="Test"
-        )
+        user = make_user()
 
         user.add_completed_mission("mission-1", 3600.0)
 
@@ -55,11 +94,9 @@ class TestUser:
         assert "mission-1" in user.completed_missions
         assert user.best_times["mission-1"] == 3600.0
 
-    def test_completion_rate(self):
+    def test_completion_rate(self, make_user: Callable[..., User]):
         """Test completion rate calculation."""
-        user = User(
-            id="u1", username="test", email="test@example.com", display_name="Test"
-        )
+        user = make_user()
 
         # No attempts yet
         assert user.get_completion_rate() == 0.0
@@ -70,19 +107,38 @@ class TestUser:
 
         assert user.get_completion_rate() == 70.0
 
+    def test_user_add_completed_mission_update_best_time(
+        self, make_user: Callable[..., User]
+    ):
+        """Test adding completed mission updates best time if better."""
+        user = make_user()
+
+        # First completion
+        user.add_completed_mission("mission-1", 3600.0)
+        assert user.best_times["mission-1"] == 3600.0
+
+        # Better time
+        user.add_completed_mission("mission-1", 3000.0)
+        assert user.best_times["mission-1"] == 3000.0
+
+        # Worse time (should not update)
+        user.add_completed_mission("mission-1", 4000.0)
+        assert user.best_times["mission-1"] == 3000.0
+
+    def test_user_repr(self, make_user: Callable[..., User]):
+        """Test User string representation."""
+        user = make_user(id="user-123", username="testuser")
+        repr_str = repr(user)
+        assert "user-123" in repr_str
+        assert "testuser" in repr_str
+
 
 class TestMission:
     """Test cases for Mission model."""
 
-    def test_mission_initialization(self):
+    def test_mission_initialization(self, new_mission: Mission):
         """Test that Mission initializes correctly."""
-        mission = Mission(
-            id="mission-001",
-            name="Test Mission",
-            type="tutorial",
-            difficulty="beginner",
-            description="A test mission",
-        )
+        mission = new_mission
 
         assert mission.id == "mission-001"
         assert mission.name == "Test Mission"
@@ -90,30 +146,18 @@ class TestMission:
         assert mission.difficulty == "beginner"
         assert mission.status == "not_started"
 
-    def test_mission_start(self):
+    def test_mission_start(self, basic_mission: Mission):
         """Test mission start."""
-        mission = Mission(
-            id="m1",
-            name="Test",
-            type="tutorial",
-            difficulty="beginner",
-            description="Test",
-        )
+        mission = basic_mission
 
         mission.start()
 
         assert mission.status == "in_progress"
         assert mission.start_time is not None
 
-    def test_complete_objective(self):
+    def test_complete_objective(self, basic_mission: Mission):
         """Test objective completion."""
-        mission = Mission(
-            id="m1",
-            name="Test",
-            type="tutorial",
-            difficulty="beginner",
-            description="Test",
-        )
+        mission = basic_mission
 
         obj = Objective(
             id="obj-1", description="Reach orbit", type="reach", target_id="earth"
@@ -125,15 +169,9 @@ class TestMission:
         assert obj.completed is True
         assert mission.objectives_completed == 1
 
-    def test_check_completion(self):
+    def test_check_completion(self, basic_mission: Mission):
         """Test completion check."""
-        mission = Mission(
-            id="m1",
-            name="Test",
-            type="tutorial",
-            difficulty="beginner",
-            description="Test",
-        )
+        mission = basic_mission
 
         # No objectives = not complete
         assert mission.check_completion() is True  # Empty list is all completed
@@ -147,44 +185,31 @@ class TestMission:
         mission.complete_objective("obj-1")
         assert mission.check_completion() is True
 
+    def test_complete_objective_already_completed(self, basic_mission: Mission):
+        """Test completing an already completed objective."""
+        mission = basic_mission
 
-class TestObjective:
-    """Test cases for Objective model."""
+        obj = Objective(id="obj-1", description="Task", type="reach", completed=True)
+        mission.objectives.append(obj)
+        initial_completed = mission.objectives_completed
 
-    def test_objective_initialization(self):
-        """Test that Objective initializes correctly."""
-        obj = Objective(
-            id="obj-001", description="Reach Mars orbit", type="reach", target_id="mars"
-        )
+        # Try to complete again
+        mission.complete_objective("obj-1")
 
-        assert obj.id == "obj-001"
-        assert obj.description == "Reach Mars orbit"
-        assert obj.type == "reach"
-        assert obj.target_id == "mars"
-        assert obj.completed is False
+        # Should not increment
+        assert mission.objectives_completed == initial_completed
 
-    def test_objective_repr(self):
-        """Test Objective string representation."""
-        obj_completed = Objective(
-            id="obj-1", description="Task", type="reach", completed=True
-        )
-        obj_incomplete = Objective(
-            id="obj-2", description="Task", type="reach", completed=False
-        )
+    def test_complete_objective_nonexistent(self, basic_mission: Mission):
+        """Test completing a non-existent objective."""
+        mission = basic_mission
 
-        assert "✓" in repr(obj_completed)
-        assert "○" in repr(obj_incomplete)
-        assert "obj-1" in repr(obj_completed)
+        # Should not raise error
+        mission.complete_objective("nonexistent-obj")
+        assert mission.objectives_completed == 0
 
-    def test_mission_get_current_objective(self):
+    def test_mission_get_current_objective(self, basic_mission: Mission):
         """Test getting current objective."""
-        mission = Mission(
-            id="m1",
-            name="Test",
-            type="tutorial",
-            difficulty="beginner",
-            description="Test",
-        )
+        mission = basic_mission
 
         # No objectives
         assert mission.get_current_objective() is None
@@ -213,81 +238,39 @@ class TestObjective:
         mission.current_objective_index = -1
         assert mission.get_current_objective() is None
 
-    def test_mission_repr(self):
+    def test_mission_repr(self, basic_mission: Mission):
         """Test Mission string representation."""
-        mission = Mission(
-            id="m1",
-            name="Test Mission",
-            type="tutorial",
-            difficulty="beginner",
-            description="Test",
-        )
+        mission = dataclasses.replace(basic_mission, name="Test Mission")
 
         repr_str = repr(mission)
         assert "m1" in repr_str
         assert "Test Mission" in repr_str
         assert "not_started" in repr_str
 
-    def test_complete_objective_already_completed(self):
-        """Test completing an already completed objective."""
-        mission = Mission(
-            id="m1",
-            name="Test",
-            type="tutorial",
-            difficulty="beginner",
-            description="Test",
-        )
-
-        obj = Objective(id="obj-1", description="Task", type="reach", completed=True)
-        mission.objectives.append(obj)
-        initial_completed = mission.objectives_completed
 
-        # Try to complete again
-        mission.complete_objective("obj-1")
-
-        # Should not increment
-        assert mission.objectives_completed == initial_completed
+class TestObjective:
+    """Test cases for Objective model."""
 
-    def test_complete_objective_nonexistent(self):
-        """Test completing a non-existent objective."""
-        mission = Mission(
-            id="m1",
-            name="Test",
-            type="tutorial",
-            difficulty="beginner",
-            description="Test",
-        )
+    def test_objective_initialization(self, new_objective: Objective):
+        """Test that Objective initializes correctly."""
+        obj = new_objective
 
-        # Should not raise error
-        mission.complete_objective("nonexistent-obj")
-        assert mission.objectives_completed == 0
+        assert obj.id == "obj-001"
+        assert obj.description == "Reach Mars orbit"
+        assert obj.type == "reach"
+        assert obj.target_id == "mars"
+        assert obj.completed is False
 
-    def test_user_add_completed_mission_update_best_time(self):
-        """Test adding completed mission updates best time if better."""
-        user = User(
-            id="u1", username="test", email="test@example.com", display_name="Test"
+    @pytest.mark.parametrize(
+        ("completed", "marker"),
+        [(True, "✓"), (False, "○")],
+        ids=["completed", "incomplete"],
+    )
+    def test_objective_repr(self, completed: bool, marker: str):
+        """Test Objective string representation."""
+        obj = Objective(
+            id="obj-1", description="Task", type="reach", completed=completed
         )
 
-        # First completion
-        user.add_completed_mission("mission-1", 3600.0)
-        assert user.best_times["mission-1"] == 3600.0
-
-        # Better time
-        user.add_completed_mission("mission-1", 3000.0)
-        assert user.best_times["mission-1"] == 3000.0
-
-        # Worse time (should not update)
-        user.add_completed_mission("mission-1", 4000.0)
-        assert user.best_times["mission-1"] == 3000.0
-
-    def test_user_repr(self):
-        """Test User string representation."""
-        user = User(
-            id="user-123",
-            username="testuser",
-            email="test@example.com",
-            display_name="Test",
-        )
-        repr_str = repr(user)
-        assert "user-123" in repr_str
-        assert "testuser" in repr_str
+        assert marker in repr(obj)
+        assert "obj-1" in repr(obj)
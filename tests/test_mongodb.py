@@ -6,56 +6,101 @@ Tests for MongoDB repository implementations.
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
+from functools import lru_cache
+
 import pytest
-from pymongo import MongoClient
 
-from src.adapters.mongodb import (
+pymongo = pytest.importorskip("pymongo")
+
+from src.adapters.mongodb import (  # noqa: E402
     MongoDatabase,
     MongoMissionRepository,
     MongoObjectiveRepository,
     MongoUserRepository,
 )
-from src.cockpit.config import MongoConfig
-from src.models import Mission, Objective, User
+from src.cockpit.config import MongoConfig  # noqa: E402
+from src.models import Mission, Objective, User  # noqa: E402
+
+MONGO_URI = "mongodb://localhost:27017"
 
 
-def _mongodb_available() -> bool:
-    """Check if MongoDB is available for testing."""
+@lru_cache(maxsize=1)
+def _shared_client() -> pymongo.MongoClient:
+    """Create the single client reused by every Mongo test in the session."""
+    return pymongo.MongoClient(MONGO_URI, serverSelectionTimeoutMS=1000)
+
+
+@pytest.fixture(scope="session")
+def mongo_client() -> Iterator[pymongo.MongoClient]:
+    """
+    Provide the shared client, skipping the requesting test when MongoDB is
+    unreachable.
+
+    The probe runs on first use rather than at import, so collection and
+    deselected runs do no network I/O. The client is closed when the
+    session finishes, including when the probe skipped.
+    """
+    client = _shared_client()
     try:
-        client = MongoClient("mongodb://localhost:27017", serverSelectionTimeoutMS=1000)
-        client.server_info()
+        try:
+            client.server_info()
+        except Exception:
+            pytest.skip("MongoDB not available")
+        yield client
+    finally:
         client.close()
-        return True
-    except Exception:
-        return False
+        _shared_client.cache_clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mongo_config() -> MongoConfig:
-    """Create MongoDB configuration for testing."""
+    """
+    Create the immutable MongoDB configuration shared by the session.
+
+    Each pytest-xdist worker gets its own database, so parallel runs never
+    see each other's documents.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
     return MongoConfig(
         host="localhost",
         port=27017,
-        database="cosmic_flight_sim_test",
+        database=f"cosmic_flight_sim_test_{worker}",
     )
 
 
-@pytest.fixture
-def mongo_db(mongo_config: MongoConfig) -> MongoDatabase:
+@pytest.fixture(scope="session")
+def mongo_db(
+    mongo_config: MongoConfig,
+    mongo_client: pymongo.MongoClient,
+) -> Iterator[MongoDatabase]:
     """
-    Create MongoDB database connection for testing.
+    Create one MongoDB database connection shared by the session.
 
-    Cleans up test database after tests.
+    The test database is dropped once, when the session finishes.
     """
-    db = MongoDatabase(mongo_config)
+    db = MongoDatabase(mongo_config, client=mongo_client)
     db.connect()
     yield db
-    # Cleanup: drop test database
     if db.client:
         db.client.drop_database(mongo_config.database)
     db.disconnect()
 
 
+@pytest.fixture(autouse=True)
+def clean_collections(mongo_db: MongoDatabase) -> Iterator[None]:
+    """
+    Empty every test collection after each test.
+
+    Documents are deleted rather than dropping the database so collections
+    and their indexes survive between tests.
+    """
+    yield
+    for name in mongo_db.db.list_collection_names():
+        mongo_db.db[name].delete_many({})
+
+
 @pytest.fixture
 def user_repo(mongo_db: MongoDatabase) -> MongoUserRepository:
     """Create user repository for testing."""
@@ -74,10 +119,6 @@ def objective_repo(mongo_db: MongoDatabase) -> MongoObjectiveRepository:
     return mongo_db.objective_repository
 
 
-@pytest.mark.skipif(
-    not _mongodb_available(),
-    reason="MongoDB not available",
-)
 class TestMongoUserRepository:
     """Tests for MongoUserRepository."""
 
@@ -139,12 +180,11 @@ class TestMongoUserRepository:
             email="test5@example.com",
             display_name="Test User 5",
         )
-        user_repo.save_user(user1)
-        user_repo.save_user(user2)
+        user_repo.save_users([user1, user2])
 
         users = user_repo.list_users()
         assert len(users) >= 2
-        user_ids = [u.id for u in users]
+        user_ids = {u.id for u in users}
         assert "test-user-4" in user_ids
         assert "test-user-5" in user_ids
 
@@ -164,10 +204,6 @@ class TestMongoUserRepository:
         assert retrieved is None
 
 
-@pytest.mark.skipif(
-    not _mongodb_available(),
-    reason="MongoDB not available",
-)
 class TestMongoMissionRepository:
     """Tests for MongoMissionRepository."""
 
@@ -241,8 +277,7 @@ class TestMongoMissionRepository:
         )
         mission2.status = "in_progress"
 
-        mission_repo.save_mission(mission1)
-        mission_repo.save_mission(mission2)
+        mission_repo.save_missions([mission1, mission2])
 
         completed = mission_repo.list_missions(status="completed")
         assert len(completed) >= 1
@@ -253,15 +288,13 @@ class TestMongoMissionRepository:
         assert all(m.type == "tutorial" for m in tutorials)
 
 
-@pytest.mark.skipif(
-    not _mongodb_available(),
-    reason="MongoDB not available",
-)
 class TestMongoObjectiveRepository:
     """Tests for MongoObjectiveRepository."""
 
     def test_save_and_get_objective(
-        self, mission_repo: MongoMissionRepository, objective_repo: MongoObjectiveRepository
+        self,
+        mission_repo: MongoMissionRepository,
+        objective_repo: MongoObjectiveRepository,
     ) -> None:
         """Test saving and retrieving objectives."""
         mission = Mission(
@@ -287,7 +320,9 @@ class TestMongoObjectiveRepository:
         assert retrieved.description == "Test objective"
 
     def test_list_objectives(
-        self, mission_repo: MongoMissionRepository, objective_repo: MongoObjectiveRepository
+        self,
+        mission_repo: MongoMissionRepository,
+        objective_repo: MongoObjectiveRepository,
     ) -> None:
         """Test listing objectives for a mission."""
         mission = Mission(
@@ -302,12 +337,10 @@ class TestMongoObjectiveRepository:
         obj1 = Objective(id="obj-1", description="Objective 1", type="reach")
         obj2 = Objective(id="obj-2", description="Objective 2", type="collect")
 
-        objective_repo.save_objective(obj1, "test-mission-obj2")
-        objective_repo.save_objective(obj2, "test-mission-obj2")
+        objective_repo.save_objectives([obj1, obj2], "test-mission-obj2")
 
         objectives = objective_repo.list_objectives("test-mission-obj2")
         assert len(objectives) == 2
-        obj_ids = [obj.id for obj in objectives]
+        obj_ids = {obj.id for obj in objectives}
         assert "obj-1" in obj_ids
         assert "obj-2" in obj_ids
-
@@ -6,11 +6,56 @@ Unit tests for physics calculations including gravity, acceleration, and vectors
 
 from __future__ import annotations
 
+import numpy as np
+import pytest
+
 from src.simulator import PhysicsEngine, Vector3D
-from src.simulator.solar_system import CelestialBody
+from src.simulator.solar_system import CelestialBody, SolarSystem
 from src.simulator.spacecraft import Spacecraft
 
 
+@pytest.fixture(scope="module")
+def ship() -> Spacecraft:
+    """
+    Scout spacecraft shared by the module.
+
+    Tests only reposition it, so each test sets `position` before use.
+    """
+    return Spacecraft(
+        id="test-ship",
+        name="Test Ship",
+        ship_type="scout",
+        mass=5000.0,
+        dry_mass=4000.0,
+        max_fuel_capacity=1000.0,
+        current_fuel=500.0,
+        max_thrust=10000.0,
+        specific_impulse=300.0,
+        cruise_speed=1000.0,
+    )
+
+
+@pytest.fixture(scope="module")
+def earth_body() -> CelestialBody:
+    """
+    Earth shared by the module.
+
+    Tests only reposition it, so each test sets `position` before use.
+    """
+    return CelestialBody(
+        id="earth",
+        name="Earth",
+        type="planet",
+        mass=5.972e24,  # kg
+        radius=6.371e6,  # meters
+        atmosphere_pressure=101.3,
+        atmosphere_depth=100000.0,
+        temperature=288.0,
+        has_atmosphere=True,
+        has_water=True,
+    )
+
+
 class TestPhysicsEngine:
     """Test cases for PhysicsEngine class."""
 
@@ -20,44 +65,16 @@ class TestPhysicsEngine:
         assert engine is not None
         assert engine.gravitational_constant == 6.67430e-11
 
-    def test_calculate_gravity(self):
+    def test_calculate_gravity(self, ship: Spacecraft, earth_body: CelestialBody):
         """Test gravitational force calculation."""
         engine = PhysicsEngine()
 
-        # Create test spacecraft
-        ship = Spacecraft(
-            id="test-ship",
-            name="Test Ship",
-            ship_type="scout",
-            mass=5000.0,
-            dry_mass=4000.0,
-            max_fuel_capacity=1000.0,
-            current_fuel=500.0,
-            max_thrust=10000.0,
-            specific_impulse=300.0,
-            cruise_speed=1000.0,
-        )
-
-        # Create test celestial body (Earth)
-        earth = CelestialBody(
-            id="earth",
-            name="Earth",
-            type="planet",
-            mass=5.972e24,  # kg
-            radius=6.371e6,  # meters
-            atmosphere_pressure=101.3,
-            atmosphere_depth=100000.0,
-            temperature=288.0,
-            has_atmosphere=True,
-            has_water=True,
-        )
-
         # Position ship at 1 AU from Earth
         ship.position = Vector3D(1.496e11, 0.0, 0.0)
-        earth.position = Vector3D(0.0, 0.0, 0.0)
+        earth_body.position = Vector3D(0.0, 0.0, 0.0)
 
         # Calculate gravity
-        force = engine.calculate_gravity(ship, earth)
+        force = engine.calculate_gravity(ship, earth_body)
 
         # Verify force is a Vector3D
         assert isinstance(force, Vector3D)
@@ -68,41 +85,40 @@ class TestPhysicsEngine:
         # Verify force points toward Earth (negative direction)
         assert force.x < 0  # Should point toward origin
 
-    def test_calculate_gravity_zero_distance(self):
+    def test_calculate_gravity_matches_vector_form(
+        self, ship: Spacecraft, earth_body: CelestialBody
+    ):
+        """Test the scalar fast path rounds exactly like the Vector3D form."""
+        engine = PhysicsEngine()
+        rng = np.random.default_rng(17)
+
+        for ship_xyz, body_xyz in rng.uniform(-1e11, 1e11, size=(200, 2, 3)):
+            ship.position = Vector3D(*ship_xyz.tolist())
+            earth_body.position = Vector3D(*body_xyz.tolist())
+            r = ship.position - earth_body.position
+            force_magnitude = (
+                engine.gravitational_constant
+                * earth_body.mass
+                * ship.get_current_mass()
+                / (r.magnitude() ** 2)
+            )
+            expected = -r.normalize() * force_magnitude
+
+            force = engine.calculate_gravity(ship, earth_body)
+
+            assert (force.x, force.y, force.z) == (expected.x, expected.y, expected.z)
+
+    def test_calculate_gravity_zero_distance(
+        self, ship: Spacecraft, earth_body: CelestialBody
+    ):
         """Test gravity calculation at zero distance."""
         engine = PhysicsEngine()
 
-        ship = Spacecraft(
-            id="test",
-            name="Test",
-            ship_type="scout",
-            mass=5000,
-            dry_mass=4000,
-            max_fuel_capacity=1000,
-            current_fuel=500,
-            max_thrust=10000,
-            specific_impulse=300,
-            cruise_speed=1000,
-        )
-
-        earth = CelestialBody(
-            id="earth",
-            name="Earth",
-            type="planet",
-            mass=5.972e24,
-            radius=6.371e6,
-            atmosphere_pressure=101.3,
-            atmosphere_depth=100000,
-            temperature=288.0,
-            has_atmosphere=True,
-            has_water=True,
-        )
-
         # Same position = zero distance
         ship.position = Vector3D(0.0, 0.0, 0.0)
-        earth.position = Vector3D(0.0, 0.0, 0.0)
+        earth_body.position = Vector3D(0.0, 0.0, 0.0)
 
-        force = engine.calculate_gravity(ship, earth)
+        force = engine.calculate_gravity(ship, earth_body)
 
         # Should return zero force at zero distance
         assert force.magnitude() == 0.0
@@ -133,3 +149,57 @@ class TestPhysicsEngine:
 
         # Should return zero acceleration for zero mass
         assert acceleration.magnitude() == 0.0
+
+    def test_calculate_gravity_batch(self, ship: Spacecraft, earth_body: CelestialBody):
+        """Test batched gravity matches the per-pair calculation."""
+        engine = PhysicsEngine()
+        earth_body.position = Vector3D(0.0, 0.0, 0.0)
+
+        # Structure-of-arrays inputs: one row per (ship, body) pair
+        ship_positions = np.array(
+            [[1.496e11, 0.0, 0.0], [0.0, 7.0e6, 0.0], [0.0, 0.0, 0.0]]
+        )
+        body_positions = np.zeros((3, 3))
+        body_masses = np.full(3, earth_body.mass)
+
+        forces = engine.calculate_gravity_batch(
+            ship_positions, ship.get_current_mass(), body_positions, body_masses
+        )
+
+        assert forces.shape == (3, 3)
+        for row, position in enumerate(ship_positions):
+            ship.position = Vector3D(*position)
+            expected = engine.calculate_gravity(ship, earth_body)
+            np.testing.assert_allclose(
+                forces[row], [expected.x, expected.y, expected.z], rtol=1e-12
+            )
+
+        # Zero distance yields zero force
+        assert np.all(forces[2] == 0.0)
+
+    def test_calculate_net_gravity(self, ship: Spacecraft, earth_body: CelestialBody):
+        """Test all-pairs net gravity matches summing per-body forces."""
+        engine = PhysicsEngine()
+        system = SolarSystem()
+        earth_body.position = Vector3D(1.496e11, 0.0, 0.0)
+        system.add_body(earth_body)
+
+        ship_positions = np.array(
+            [[1.496e11, 7.0e6, 0.0], [5.0e10, -2.0e10, 1.0e9], [1.496e11, 0.0, 0.0]]
+        )
+        forces = engine.calculate_net_gravity(
+            ship_positions,
+            ship.get_current_mass(),
+            system.position_array,
+            system.mass_array,
+        )
+
+        assert forces.shape == (3, 3)
+        for row, position in enumerate(ship_positions):
+            ship.position = Vector3D(*position)
+            expected = Vector3D(0.0, 0.0, 0.0)
+            for body in system.bodies.values():
+                expected = expected + engine.calculate_gravity(ship, body)
+            np.testing.assert_allclose(
+                forces[row], [expected.x, expected.y, expected.z], rtol=1e-12
+            )
@@ -6,18 +6,75 @@ Covers project creation, retrieval, listing, updating, and deletion.
 
 from __future__ import annotations
 
+import itertools
+from datetime import timedelta
+from typing import Any
+
 import pytest
 
 from src.cockpit.memory import InMemoryProjectRepository
 from src.cockpit.services import ProjectService
 from src.models import Project
 
+_PROJECT_DEFAULTS = {
+    "id": "proj-1",
+    "user_id": "user-1",
+    "name": "Test",
+    "description": "Test",
+    "mission_type": "tutorial",
+    "difficulty": "beginner",
+}
+
+
+def _mk_project(**overrides: Any) -> Project:
+    """Build a Project from default fields, applying keyword overrides."""
+    return Project(**{**_PROJECT_DEFAULTS, **overrides})
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def project_service() -> ProjectService:
-    """Create a ProjectService for testing."""
+    """Create one ProjectService with sequential IDs shared by the module."""
     project_repo = InMemoryProjectRepository()
-    return ProjectService(project_repository=project_repo)
+    counter = itertools.count(1)
+    return ProjectService(
+        project_repository=project_repo,
+        id_factory=lambda: f"project-{next(counter)}",
+    )
+
+
+@pytest.fixture(scope="module")
+def populated_project_service() -> ProjectService:
+    """
+    Create a read-only ProjectService seeded for the listing tests.
+
+    It owns its own repository, so the autouse reset of `project_service`
+    never clears it. Tests using it must not create, update or delete.
+    """
+    seeds = [
+        ("seed-1", "user-1", "Public Tutorial", "tutorial", "beginner", True),
+        ("seed-2", "user-1", "Private Tutorial", "tutorial", "beginner", False),
+        ("seed-3", "user-1", "Public Challenge", "challenge", "intermediate", True),
+        ("seed-4", "user-2", "Public Challenge 2", "challenge", "intermediate", True),
+    ]
+    repo = InMemoryProjectRepository()
+    repo.bulk_load(
+        _mk_project(
+            id=project_id,
+            user_id=user_id,
+            name=name,
+            mission_type=mission_type,
+            difficulty=difficulty,
+            is_public=is_public,
+        )
+        for project_id, user_id, name, mission_type, difficulty, is_public in seeds
+    )
+    return ProjectService(project_repository=repo)
+
+
+@pytest.fixture(autouse=True)
+def _reset(project_service: ProjectService) -> None:
+    """Start every test with an empty project repository."""
+    project_service.project_repository.clear()
 
 
 class TestProjectServiceCreate:
@@ -57,6 +114,28 @@ class TestProjectServiceCreate:
 
         assert project.id == "custom-project-001"
 
+    def test_create_project_uses_id_factory(self) -> None:
+        """Test projects without an explicit ID take the injected factory's IDs."""
+        counter = itertools.count(1)
+        service = ProjectService(
+            project_repository=InMemoryProjectRepository(),
+            id_factory=lambda: f"project-{next(counter)}",
+        )
+
+        ids = [
+            service.create_project(
+                user_id="user-123",
+                name="Mars Mission",
+                description="Journey to Mars",
+                mission_type="challenge",
+                difficulty="intermediate",
+            ).id
+            for _ in range(2)
+        ]
+
+        assert ids == ["project-1", "project-2"]
+        assert service.get_project("project-2") is not None
+
     def test_create_project_with_all_fields(
         self, project_service: ProjectService
     ) -> None:
@@ -121,33 +200,33 @@ class TestProjectServiceCreate:
                 difficulty="invalid",
             )
 
-    def test_create_project_all_valid_mission_types(
-        self, project_service: ProjectService
+    @pytest.mark.parametrize("mission_type", ["tutorial", "free_flight", "challenge"])
+    def test_create_project_mission_type(
+        self, project_service: ProjectService, mission_type: str
     ) -> None:
-        """Test project creation with all valid mission types."""
-        for mission_type in ["tutorial", "free_flight", "challenge"]:
-            project = project_service.create_project(
-                user_id="user-123",
-                name=f"Test {mission_type}",
-                description="Test",
-                mission_type=mission_type,
-                difficulty="beginner",
-            )
-            assert project.mission_type == mission_type
+        """Test project creation with each valid mission type."""
+        project = project_service.create_project(
+            user_id="user-123",
+            name=f"Test {mission_type}",
+            description="Test",
+            mission_type=mission_type,
+            difficulty="beginner",
+        )
+        assert project.mission_type == mission_type
 
-    def test_create_project_all_valid_difficulties(
-        self, project_service: ProjectService
+    @pytest.mark.parametrize("difficulty", ["beginner", "intermediate", "advanced"])
+    def test_create_project_difficulty(
+        self, project_service: ProjectService, difficulty: str
     ) -> None:
-        """Test project creation with all valid difficulty levels."""
-        for difficulty in ["beginner", "intermediate", "advanced"]:
-            project = project_service.create_project(
-                user_id="user-123",
-                name=f"Test {difficulty}",
-                description="Test",
-                mission_type="tutorial",
-                difficulty=difficulty,
-            )
-            assert project.difficulty == difficulty
+        """Test project creation with each valid difficulty level."""
+        project = project_service.create_project(
+            user_id="user-123",
+            name=f"Test {difficulty}",
+            description="Test",
+            mission_type="tutorial",
+            difficulty=difficulty,
+        )
+        assert project.difficulty == difficulty
 
 
 class TestProjectServiceRetrieve:
@@ -177,112 +256,44 @@ class TestProjectServiceRetrieve:
 class TestProjectServiceList:
     """Test project listing in ProjectService."""
 
-    def test_list_user_projects(self, project_service: ProjectService) -> None:
+    def test_list_user_projects(
+        self, populated_project_service: ProjectService
+    ) -> None:
         """Test listing projects for a specific user."""
-        # Create projects for different users
-        project_service.create_project(
-            user_id="user-1",
-            name="User 1 Project",
-            description="Test",
-            mission_type="tutorial",
-            difficulty="beginner",
-        )
-        project_service.create_project(
-            user_id="user-2",
-            name="User 2 Project",
-            description="Test",
-            mission_type="tutorial",
-            difficulty="beginner",
-        )
-        project_service.create_project(
-            user_id="user-1",
-            name="User 1 Project 2",
-            description="Test",
-            mission_type="challenge",
-            difficulty="intermediate",
-        )
-
-        projects = project_service.list_user_projects("user-1")
-        assert len(projects) == 2
+        projects = populated_project_service.list_user_projects("user-1")
+        assert len(projects) == 3
         assert all(p.user_id == "user-1" for p in projects)
 
+        projects = populated_project_service.list_user_projects("user-2")
+        assert [p.name for p in projects] == ["Public Challenge 2"]
+
     def test_list_user_projects_with_type_filter(
-        self, project_service: ProjectService
+        self, populated_project_service: ProjectService
     ) -> None:
         """Test listing user projects with mission type filter."""
-        project_service.create_project(
-            user_id="user-1",
-            name="Tutorial",
-            description="Test",
-            mission_type="tutorial",
-            difficulty="beginner",
-        )
-        project_service.create_project(
-            user_id="user-1",
-            name="Challenge",
-            description="Test",
-            mission_type="challenge",
-            difficulty="intermediate",
+        projects = populated_project_service.list_user_projects(
+            "user-1", mission_type="tutorial"
         )
+        assert {p.name for p in projects} == {"Public Tutorial", "Private Tutorial"}
+        assert all(p.mission_type == "tutorial" for p in projects)
 
-        projects = project_service.list_user_projects("user-1", mission_type="tutorial")
-        assert len(projects) == 1
-        assert projects[0].mission_type == "tutorial"
-
-    def test_list_public_projects(self, project_service: ProjectService) -> None:
+    def test_list_public_projects(
+        self, populated_project_service: ProjectService
+    ) -> None:
         """Test listing public projects."""
-        project_service.create_project(
-            user_id="user-1",
-            name="Public Project",
-            description="Test",
-            mission_type="tutorial",
-            difficulty="beginner",
-            is_public=True,
-        )
-        project_service.create_project(
-            user_id="user-1",
-            name="Private Project",
-            description="Test",
-            mission_type="tutorial",
-            difficulty="beginner",
-            is_public=False,
-        )
-        project_service.create_project(
-            user_id="user-2",
-            name="Another Public",
-            description="Test",
-            mission_type="challenge",
-            difficulty="intermediate",
-            is_public=True,
-        )
-
-        public_projects = project_service.list_public_projects()
-        assert len(public_projects) == 2
+        public_projects = populated_project_service.list_public_projects()
+        assert len(public_projects) == 3
         assert all(p.is_public for p in public_projects)
 
     def test_list_public_projects_with_type_filter(
-        self, project_service: ProjectService
+        self, populated_project_service: ProjectService
     ) -> None:
         """Test listing public projects with mission type filter."""
-        project_service.create_project(
-            user_id="user-1",
-            name="Public Tutorial",
-            description="Test",
-            mission_type="tutorial",
-            difficulty="beginner",
-            is_public=True,
+        projects = populated_project_service.list_public_projects(
+            mission_type="tutorial"
         )
-        project_service.create_project(
-            user_id="user-2",
-            name="Public Challenge",
-            description="Test",
-            mission_type="challenge",
-            difficulty="intermediate",
-            is_public=True,
-        )
-
-        projects = project_service.list_public_projects(mission_type="tutorial")
         assert len(projects) == 1
+        assert projects[0].name == "Public Tutorial"
         assert projects[0].mission_type == "tutorial"
 
 
@@ -320,7 +331,7 @@ class TestProjectServiceUpdate:
         )
 
         project.name = ""
-        with pytest.raises(ValueError, match="cannot be empty"):
+        with pytest.raises(ValueError):
             project_service.update_project(project)
 
     def test_update_project_invalid_mission_type(
@@ -336,7 +347,7 @@ class TestProjectServiceUpdate:
         )
 
         project.mission_type = "invalid"
-        with pytest.raises(ValueError, match="Invalid mission type"):
+        with pytest.raises(ValueError):
             project_service.update_project(project)
 
     def test_update_project_invalid_difficulty(
@@ -352,10 +363,95 @@ class TestProjectServiceUpdate:
         )
 
         project.difficulty = "invalid"
-        with pytest.raises(ValueError, match="Invalid difficulty"):
+        with pytest.raises(ValueError):
             project_service.update_project(project)
 
 
+class TestProjectServicePatch:
+    """Test partial project updates in ProjectService."""
+
+    @pytest.mark.parametrize(
+        ("changes", "expected"),
+        [
+            ({"name": "  Renamed  "}, {"name": "Renamed"}),
+            ({"description": "New"}, {"description": "New"}),
+            (
+                {"mission_type": "challenge", "difficulty": "advanced"},
+                {"mission_type": "challenge", "difficulty": "advanced"},
+            ),
+            (
+                {"is_public": True, "max_fuel": 500.0},
+                {"is_public": True, "max_fuel": 500.0},
+            ),
+        ],
+        ids=["name", "description", "type-and-difficulty", "config"],
+    )
+    def test_patch_project_success(
+        self,
+        project_service: ProjectService,
+        changes: dict[str, object],
+        expected: dict[str, object],
+    ) -> None:
+        """Test patching updates only the supplied fields."""
+        project = project_service.create_project(
+            user_id="user-123",
+            name="Original",
+            description="Original Description",
+            mission_type="tutorial",
+            difficulty="beginner",
+        )
+
+        patched = project_service.patch_project(project.id, **changes)
+
+        stored = project_service.get_project(project.id)
+        assert stored is not None
+        for field_name, value in expected.items():
+            assert getattr(patched, field_name) == value
+            assert getattr(stored, field_name) == value
+        untouched = {"name", "description", "mission_type", "difficulty"} - set(changes)
+        for field_name in untouched:
+            assert getattr(stored, field_name) == getattr(project, field_name)
+        assert stored.updated_at > project.updated_at
+
+    @pytest.mark.parametrize(
+        ("changes", "message"),
+        [
+            ({"name": "  "}, "cannot be empty"),
+            ({"mission_type": "invalid"}, "Invalid mission type"),
+            ({"difficulty": "invalid"}, "Invalid difficulty"),
+            ({"user_id": "someone-else"}, "Cannot patch project fields: user_id"),
+        ],
+        ids=["empty-name", "mission-type", "difficulty", "read-only-field"],
+    )
+    def test_patch_project_invalid(
+        self,
+        project_service: ProjectService,
+        changes: dict[str, object],
+        message: str,
+    ) -> None:
+        """Test invalid patches raise and leave the project unchanged."""
+        project = project_service.create_project(
+            user_id="user-123",
+            name="Original",
+            description="Test",
+            mission_type="tutorial",
+            difficulty="beginner",
+        )
+
+        with pytest.raises(ValueError, match=message):
+            project_service.patch_project(project.id, **changes)
+
+        stored = project_service.get_project(project.id)
+        assert stored is not None
+        assert stored.name == "Original"
+        assert stored.user_id == "user-123"
+
+    def test_patch_project_not_found(self, project_service: ProjectService) -> None:
+        """Test patching a non-existent project raises."""
+        with pytest.raises(ValueError, match="not found"):
+            project_service.patch_project("non-existent", name="Renamed")
+
+
 class TestProjectServiceDelete:
     """Test project deletion in ProjectService."""
 
@@ -384,14 +480,7 @@ class TestProjectModel:
 
     def test_add_objective_template(self) -> None:
         """Test adding objective templates to a project."""
-        project = Project(
-            id="proj-1",
-            user_id="user-1",
-            name="Test",
-            description="Test",
-            mission_type="tutorial",
-            difficulty="beginner",
-        )
+        project = _mk_project()
 
         project.add_objective_template(
             description="Reach Mars",
@@ -406,14 +495,7 @@ class TestProjectModel:
 
     def test_update_metadata(self) -> None:
         """Test updating project metadata."""
-        project = Project(
-            id="proj-1",
-            user_id="user-1",
-            name="Original",
-            description="Original Desc",
-            mission_type="tutorial",
-            difficulty="beginner",
-        )
+        project = _mk_project(name="Original", description="Original Desc")
 
         original_updated = project.updated_at
         project.update_metadata(name="Updated", description="Updated Desc")
@@ -422,16 +504,19 @@ class TestProjectModel:
         assert project.description == "Updated Desc"
         assert project.updated_at > original_updated
 
+    def test_update_metadata_with_shared_timestamp(self) -> None:
+        """Test several changes can record one caller-supplied timestamp."""
+        project = _mk_project()
+        now = project.created_at + timedelta(seconds=5)
+
+        project.add_objective_template(description="Reach Mars", now=now)
+        project.update_metadata(name="Updated", now=now)
+
+        assert project.updated_at == now
+
     def test_update_metadata_partial(self) -> None:
         """Test updating project metadata with partial updates."""
-        project = Project(
-            id="proj-1",
-            user_id="user-1",
-            name="Original",
-            description="Original Desc",
-            mission_type="tutorial",
-            difficulty="beginner",
-        )
+        project = _mk_project(name="Original", description="Original Desc")
 
         project.update_metadata(name="Updated Only Name")
 
@@ -4,12 +4,12 @@ Tests for application services.
 
 from __future__ import annotations
 
-from copy import deepcopy
+import itertools
 from typing import Dict, List, Optional
 
 import pytest
 
-from src.cockpit.memory import InMemoryUserRepository
+from src.cockpit.memory import InMemoryUserRepository, clone_mission
 from src.cockpit.services import MissionService, UserService
 from src.cockpit.storage import MissionRepository
 from src.models import Mission
@@ -22,11 +22,11 @@ class InMemoryMissionRepository(MissionRepository):
         self._missions: Dict[str, Mission] = {}
 
     def save_mission(self, mission: Mission) -> None:
-        self._missions[mission.id] = deepcopy(mission)
+        self._missions[mission.id] = clone_mission(mission)
 
     def get_mission(self, mission_id: str) -> Optional[Mission]:
         mission = self._missions.get(mission_id)
-        return deepcopy(mission) if mission else None
+        return clone_mission(mission) if mission is not None else None
 
     def list_missions(
         self,
@@ -40,22 +40,47 @@ class InMemoryMissionRepository(MissionRepository):
                 continue
             if mission_type and mission.type != mission_type:
                 continue
-            filtered.append(deepcopy(mission))
+            filtered.append(clone_mission(mission))
         return filtered
 
     def delete_mission(self, mission_id: str) -> None:
         self._missions.pop(mission_id, None)
 
+    def clear(self) -> None:
+        """Remove all stored missions."""
+        self._missions.clear()
+
+
+@pytest.fixture(scope="module")
+def user_service() -> UserService:
+    """Create one UserService shared by the module."""
+    return UserService(InMemoryUserRepository())
+
+
+@pytest.fixture(scope="module")
+def mission_service() -> MissionService:
+    """Create one MissionService with sequential IDs shared by the module."""
+    counter = itertools.count(1)
+    return MissionService(
+        InMemoryMissionRepository(), id_factory=lambda: f"mission-{next(counter)}"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset(user_service: UserService, mission_service: MissionService) -> None:
+    """Start every test with empty repositories."""
+    user_service.user_repository.clear()
+    mission_service.mission_repository.clear()
+
 
 class TestUserService:
     """Tests for UserService."""
 
-    def test_create_user_with_custom_id(self) -> None:
+    def test_create_user_with_custom_id(self, user_service: UserService) -> None:
         """Test creating a user with a custom user ID."""
-        repo = InMemoryUserRepository()
-        service = UserService(repo)
+        repo = user_service.user_repository
 
-        user = service.create_user(
+        user = user_service.create_user(
             username="testuser",
             email="test@example.com",
             display_name="Test User",
@@ -66,67 +91,54 @@ class TestUserService:
         assert user.username == "testuser"
         assert repo.get_user("custom-id-123") == user
 
-    def test_create_user_duplicate_username(self) -> None:
+    def test_create_user_duplicate_username(self, user_service: UserService) -> None:
         """Test creating a user with duplicate username raises ValueError."""
-        repo = InMemoryUserRepository()
-        service = UserService(repo)
-
-        service.create_user(
+        user_service.create_user(
             username="testuser", email="test1@example.com", display_name="User 1"
         )
 
         with pytest.raises(ValueError, match="Username 'testuser' already exists"):
-            service.create_user(
+            user_service.create_user(
                 username="testuser", email="test2@example.com", display_name="User 2"
             )
 
-    def test_create_user_duplicate_email(self) -> None:
+    def test_create_user_duplicate_email(self, user_service: UserService) -> None:
         """Test creating a user with duplicate email raises ValueError."""
-        repo = InMemoryUserRepository()
-        service = UserService(repo)
-
-        service.create_user(
+        user_service.create_user(
             username="user1", email="test@example.com", display_name="User 1"
         )
 
         with pytest.raises(ValueError, match="Email 'test@example.com' already exists"):
-            service.create_user(
+            user_service.create_user(
                 username="user2", email="test@example.com", display_name="User 2"
             )
 
-    def test_get_user_existing(self) -> None:
+    def test_get_user_existing(self, user_service: UserService) -> None:
         """Test getting an existing user."""
-        repo = InMemoryUserRepository()
-        service = UserService(repo)
-
-        created = service.create_user(
+        created = user_service.create_user(
             username="testuser", email="test@example.com", display_name="Test User"
         )
 
-        retrieved = service.get_user(created.id)
+        retrieved = user_service.get_user(created.id)
         assert retrieved is not None
         assert retrieved.id == created.id
         assert retrieved.username == "testuser"
 
-    def test_get_user_nonexistent(self) -> None:
+    def test_get_user_nonexistent(self, user_service: UserService) -> None:
         """Test getting a non-existent user returns None."""
-        repo = InMemoryUserRepository()
-        service = UserService(repo)
-
-        result = service.get_user("nonexistent-id")
+        result = user_service.get_user("nonexistent-id")
         assert result is None
 
-    def test_update_user(self) -> None:
+    def test_update_user(self, user_service: UserService) -> None:
         """Test updating a user."""
-        repo = InMemoryUserRepository()
-        service = UserService(repo)
+        repo = user_service.user_repository
 
-        user = service.create_user(
+        user = user_service.create_user(
             username="testuser", email="test@example.com", display_name="Test User"
         )
 
         user.display_name = "Updated Name"
-        service.update_user(user)
+        user_service.update_user(user)
 
         updated = repo.get_user(user.id)
         assert updated is not None
@@ -136,12 +148,13 @@ class TestUserService:
 class TestMissionService:
     """Tests for MissionService."""
 
-    def test_create_mission_with_custom_id(self) -> None:
+    def test_create_mission_with_custom_id(
+        self, mission_service: MissionService
+    ) -> None:
         """Test creating a mission with a custom mission ID."""
-        repo = InMemoryMissionRepository()
-        service = MissionService(repo)
+        repo = mission_service.mission_repository
 
-        mission = service.create_mission(
+        mission = mission_service.create_mission(
             name="Test Mission",
             mission_type="tutorial",
             difficulty="beginner",
@@ -154,9 +167,8 @@ class TestMissionService:
         assert repo.get_mission("custom-mission-123") == mission
 
     def test_create_mission_auto_generated_id(self) -> None:
-        """Test creating a mission with auto-generated ID."""
-        repo = InMemoryMissionRepository()
-        service = MissionService(repo)
+        """Test creating a mission with the default random ID."""
+        service = MissionService(InMemoryMissionRepository())
 
         mission = service.create_mission(
             name="Test Mission",
@@ -168,37 +180,52 @@ class TestMissionService:
         assert mission.id.startswith("mission-")
         assert len(mission.id) > 8
 
-    def test_get_mission_existing(self) -> None:
-        """Test getting an existing mission."""
-        repo = InMemoryMissionRepository()
-        service = MissionService(repo)
+    def test_create_mission_uses_id_factory(self) -> None:
+        """Test missions without an explicit ID take the injected factory's IDs."""
+        counter = itertools.count(1)
+        service = MissionService(
+            InMemoryMissionRepository(), id_factory=lambda: f"mission-{next(counter)}"
+        )
+
+        ids = [
+            service.create_mission(
+                name="Test Mission",
+                mission_type="tutorial",
+                difficulty="beginner",
+                description="A test mission",
+            ).id
+            for _ in range(2)
+        ]
 
-        created = service.create_mission(
+        assert ids == ["mission-1", "mission-2"]
+        assert service.get_mission("mission-2") is not None
+
+    def test_get_mission_existing(self, mission_service: MissionService) -> None:
+        """Test getting an existing mission."""
+        created = mission_service.create_mission(
             name="Test Mission",
             mission_type="tutorial",
             difficulty="beginner",
             description="A test mission",
         )
 
-        retrieved = service.get_mission(created.id)
+        retrieved = mission_service.get_mission(created.id)
         assert retrieved is not None
         assert retrieved.id == created.id
         assert retrieved.name == "Test Mission"
 
-    def test_get_mission_nonexistent(self) -> None:
+    def test_get_mission_nonexistent(self, mission_service: MissionService) -> None:
         """Test getting a non-existent mission returns None."""
-        repo = InMemoryMissionRepository()
-        service = MissionService(repo)
-
-        result = service.get_mission("nonexistent-id")
+        result = mission_service.get_mission("nonexistent-id")
         assert result is None
 
-    def test_list_user_missions_with_status_filter(self) -> None:
+    def test_list_user_missions_with_status_filter(
+        self, mission_service: MissionService
+    ) -> None:
         """Test listing missions with status filter."""
-        repo = InMemoryMissionRepository()
-        service = MissionService(repo)
+        repo = mission_service.mission_repository
 
-        mission1 = service.create_mission(
+        mission1 = mission_service.create_mission(
             name="Mission 1",
             mission_type="tutorial",
             difficulty="beginner",
@@ -206,7 +233,7 @@ class TestMissionService:
         )
         mission1.status = "completed"
 
-        mission2 = service.create_mission(
+        mission2 = mission_service.create_mission(
             name="Mission 2",
             mission_type="challenge",
             difficulty="intermediate",
@@ -217,22 +244,23 @@ class TestMissionService:
         repo.save_mission(mission1)
         repo.save_mission(mission2)
 
-        completed = service.list_user_missions("user-123", status="completed")
+        completed = mission_service.list_user_missions("user-123", status="completed")
         assert len(completed) == 1
         assert completed[0].id == mission1.id
 
-    def test_list_user_missions_no_filter(self) -> None:
+    def test_list_user_missions_no_filter(
+        self, mission_service: MissionService
+    ) -> None:
         """Test listing missions without status filter."""
-        repo = InMemoryMissionRepository()
-        service = MissionService(repo)
+        repo = mission_service.mission_repository
 
-        mission1 = service.create_mission(
+        mission1 = mission_service.create_mission(
             name="Mission 1",
             mission_type="tutorial",
             difficulty="beginner",
             description="Mission 1",
         )
-        mission2 = service.create_mission(
+        mission2 = mission_service.create_mission(
             name="Mission 2",
             mission_type="challenge",
             difficulty="intermediate",
@@ -242,15 +270,14 @@ class TestMissionService:
         repo.save_mission(mission1)
         repo.save_mission(mission2)
 
-        all_missions = service.list_user_missions("user-123")
+        all_missions = mission_service.list_user_missions("user-123")
         assert len(all_missions) >= 2
 
-    def test_update_mission(self) -> None:
+    def test_update_mission(self, mission_service: MissionService) -> None:
         """Test updating a mission."""
-        repo = InMemoryMissionRepository()
-        service = MissionService(repo)
+        repo = mission_service.mission_repository
 
-        mission = service.create_mission(
+        mission = mission_service.create_mission(
             name="Test Mission",
             mission_type="tutorial",
             difficulty="beginner",
@@ -259,7 +286,7 @@ class TestMissionService:
 
         mission.name = "Updated Mission"
         mission.status = "completed"
-        service.update_mission(mission)
+        mission_service.update_mission(mission)
 
         updated = repo.get_mission(mission.id)
         assert updated is not None
@@ -4,64 +4,93 @@ Comprehensive tests for simulator modules.
 
 from __future__ import annotations
 
+import math
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from src.simulator import solar_system
 from src.simulator.physics import PhysicsEngine
 from src.simulator.solar_system import CelestialBody, SolarSystem
 from src.simulator.spacecraft import Spacecraft
 from src.simulator.types import Vector3D
 
 
+@pytest.fixture(scope="module")
+def engine() -> PhysicsEngine:
+    """Physics engine shared by the module; it holds no per-test state."""
+    return PhysicsEngine()
+
+
+@pytest.fixture
+def base_ship() -> Spacecraft:
+    """
+    Fresh scout spacecraft for one test.
+
+    Function-scoped because tests mutate it; `dataclasses.replace` on a shared
+    instance would still share its mutable Vector3D fields, so tests adjust
+    the fields they need on this copy instead.
+    """
+    return Spacecraft(
+        id="ship-1",
+        name="Test Ship",
+        ship_type="scout",
+        mass=1000.0,
+        dry_mass=800.0,
+        max_fuel_capacity=200.0,
+        current_fuel=100.0,
+        max_thrust=10000.0,
+        specific_impulse=300.0,
+        cruise_speed=100.0,
+    )
+
+
+@pytest.fixture
+def earth_body() -> CelestialBody:
+    """Fresh Earth at the origin for one test."""
+    return CelestialBody(
+        id="earth",
+        name="Earth",
+        type="planet",
+        mass=5.972e24,
+        radius=6.371e6,
+        atmosphere_pressure=101.3,
+        atmosphere_depth=100000.0,
+        temperature=288.0,
+        has_atmosphere=True,
+        has_water=True,
+    )
+
+
 class TestPhysicsEngine:
     """Tests for PhysicsEngine."""
 
-    def test_calculate_gravity_zero_distance(self) -> None:
+    def test_calculate_gravity_zero_distance(
+        self,
+        engine: PhysicsEngine,
+        base_ship: Spacecraft,
+        earth_body: CelestialBody,
+        assert_vec_close: Callable[..., None],
+    ) -> None:
         """Test gravity calculation when distance is zero."""
-        engine = PhysicsEngine()
-        spacecraft = Spacecraft(
-            id="ship-1",
-            name="Test Ship",
-            ship_type="scout",
-            mass=1000.0,
-            dry_mass=800.0,
-            max_fuel_capacity=200.0,
-            current_fuel=100.0,
-            max_thrust=10000.0,
-            specific_impulse=300.0,
-            cruise_speed=100.0,
-        )
-        spacecraft.position = Vector3D(0.0, 0.0, 0.0)
-
-        body = CelestialBody(
-            id="earth",
-            name="Earth",
-            type="planet",
-            mass=5.972e24,
-            radius=6.371e6,
-            atmosphere_pressure=101.3,
-            atmosphere_depth=100000.0,
-            temperature=288.0,
-            has_atmosphere=True,
-            has_water=True,
-        )
-        body.position = Vector3D(0.0, 0.0, 0.0)
+        base_ship.position = Vector3D(0.0, 0.0, 0.0)
+        earth_body.position = Vector3D(0.0, 0.0, 0.0)
 
-        force = engine.calculate_gravity(spacecraft, body)
-        assert force.x == 0.0
-        assert force.y == 0.0
-        assert force.z == 0.0
+        force = engine.calculate_gravity(base_ship, earth_body)
+        assert_vec_close(force, (0.0, 0.0, 0.0), atol=0.0)
 
-    def test_calculate_acceleration_zero_mass(self) -> None:
+    def test_calculate_acceleration_zero_mass(
+        self, engine: PhysicsEngine, assert_vec_close: Callable[..., None]
+    ) -> None:
         """Test acceleration calculation with zero mass."""
-        engine = PhysicsEngine()
         force = Vector3D(100.0, 0.0, 0.0)
 
         acceleration = engine.calculate_acceleration(force, 0.0)
-        assert acceleration.x == 0.0
-        assert acceleration.y == 0.0
-        assert acceleration.z == 0.0
+        assert_vec_close(acceleration, (0.0, 0.0, 0.0), atol=0.0)
 
-    def test_physics_engine_repr(self) -> None:
+    def test_physics_engine_repr(self, engine: PhysicsEngine) -> None:
         """Test PhysicsEngine string representation."""
-        engine = PhysicsEngine()
         assert "PhysicsEngine" in repr(engine)
 
 
@@ -86,22 +115,9 @@ class TestCelestialBody:
         gravity = body.get_surface_gravity()
         assert gravity == 0.0
 
-    def test_get_surface_gravity_normal(self) -> None:
+    def test_get_surface_gravity_normal(self, earth_body: CelestialBody) -> None:
         """Test surface gravity calculation with normal radius."""
-        body = CelestialBody(
-            id="earth",
-            name="Earth",
-            type="planet",
-            mass=5.972e24,
-            radius=6.371e6,
-            atmosphere_pressure=101.3,
-            atmosphere_depth=100000.0,
-            temperature=288.0,
-            has_atmosphere=True,
-            has_water=True,
-        )
-
-        gravity = body.get_surface_gravity()
+        gravity = earth_body.get_surface_gravity()
         # Earth's surface gravity is approximately 9.81 m/s²
         assert 9.0 < gravity < 10.0
 
@@ -124,52 +140,34 @@ class TestCelestialBody:
         position = Vector3D(1.0e6, 0.0, 0.0)
         assert body.is_in_atmosphere(position) is False
 
-    def test_is_in_atmosphere_within(self) -> None:
-        """Test atmosphere check when position is within atmosphere."""
-        body = CelestialBody(
-            id="earth",
-            name="Earth",
-            type="planet",
-            mass=5.972e24,
-            radius=6.371e6,
-            atmosphere_pressure=101.3,
-            atmosphere_depth=100000.0,
-            temperature=288.0,
-            has_atmosphere=True,
-            has_water=True,
-        )
-        body.position = Vector3D(0.0, 0.0, 0.0)
-
-        # Position within atmosphere
-        position = Vector3D(6.4e6, 0.0, 0.0)  # Just above surface
-        assert body.is_in_atmosphere(position) is True
-
-    def test_get_distance_to_surface(self) -> None:
+    @pytest.mark.parametrize(
+        ("position", "expected"),
+        [
+            (Vector3D(6.4e6, 0.0, 0.0), True),  # Just above surface
+            (Vector3D(0.0, 6.471e6, 0.0), True),  # Top of atmosphere is inclusive
+            (Vector3D(0.0, 0.0, -6.5e6), False),  # Just beyond the atmosphere
+            (Vector3D(1.0e8, 0.0, 0.0), False),
+        ],
+    )
+    def test_is_in_atmosphere(
+        self, earth_body: CelestialBody, position: Vector3D, expected: bool
+    ) -> None:
+        """Test atmosphere check around a body with an atmosphere."""
+        assert earth_body.is_in_atmosphere(position) is expected
+
+    @pytest.mark.parametrize(
+        ("position", "expected"),
+        [
+            (Vector3D(7.0e6, 0.0, 0.0), 7.0e6 - 6.371e6),  # Above surface
+            (Vector3D(5.0e6, 0.0, 0.0), 5.0e6 - 6.371e6),  # Below surface
+        ],
+    )
+    def test_get_distance_to_surface(
+        self, earth_body: CelestialBody, position: Vector3D, expected: float
+    ) -> None:
         """Test distance to surface calculation."""
-        body = CelestialBody(
-            id="earth",
-            name="Earth",
-            type="planet",
-            mass=5.972e24,
-            radius=6.371e6,
-            atmosphere_pressure=101.3,
-            atmosphere_depth=100000.0,
-            temperature=288.0,
-            has_atmosphere=True,
-            has_water=True,
-        )
-        body.position = Vector3D(0.0, 0.0, 0.0)
-
-        # Position above surface
-        position = Vector3D(7.0e6, 0.0, 0.0)
-        distance = body.get_distance_to_surface(position)
-        assert distance > 0.0
-        assert abs(distance - (7.0e6 - 6.371e6)) < 1.0
-
-        # Position below surface (negative distance)
-        position = Vector3D(5.0e6, 0.0, 0.0)
-        distance = body.get_distance_to_surface(position)
-        assert distance < 0.0
+        distance = earth_body.get_distance_to_surface(position)
+        assert math.isclose(distance, expected, rel_tol=0.0, abs_tol=1.0)
 
     def test_celestial_body_post_init(self) -> None:
         """Test that position and velocity are initialized if None."""
@@ -193,22 +191,9 @@ class TestCelestialBody:
         assert body.position.x == 0.0
         assert body.velocity.x == 0.0
 
-    def test_celestial_body_repr(self) -> None:
+    def test_celestial_body_repr(self, earth_body: CelestialBody) -> None:
         """Test CelestialBody string representation."""
-        body = CelestialBody(
-            id="earth",
-            name="Earth",
-            type="planet",
-            mass=5.972e24,
-            radius=6.371e6,
-            atmosphere_pressure=101.3,
-            atmosphere_depth=100000.0,
-            temperature=288.0,
-            has_atmosphere=True,
-            has_water=True,
-        )
-
-        repr_str = repr(body)
+        repr_str = repr(earth_body)
         assert "earth" in repr_str
         assert "Earth" in repr_str
         assert "planet" in repr_str
@@ -227,22 +212,11 @@ class TestSolarSystem:
         nearest = system.get_nearest_body(position)
         assert nearest is None
 
-    def test_get_nearest_body(self) -> None:
+    def test_get_nearest_body(self, earth_body: CelestialBody) -> None:
         """Test getting nearest body."""
         system = SolarSystem()
 
-        earth = CelestialBody(
-            id="earth",
-            name="Earth",
-            type="planet",
-            mass=5.972e24,
-            radius=6.371e6,
-            atmosphere_pressure=101.3,
-            atmosphere_depth=100000.0,
-            temperature=288.0,
-            has_atmosphere=True,
-            has_water=True,
-        )
+        earth = earth_body
         earth.position = Vector3D(1.5e11, 0.0, 0.0)  # 1 AU
 
         mars = CelestialBody(
@@ -268,170 +242,359 @@ class TestSolarSystem:
         assert nearest is not None
         assert nearest.id == "earth"
 
-    def test_solar_system_repr(self) -> None:
-        """Test SolarSystem string representation."""
+    def test_get_nearest_body_follows_moved_bodies(self) -> None:
+        """Test spatial queries see bodies moved after they were added."""
         system = SolarSystem()
-        repr_str = repr(system)
-        assert "SolarSystem" in repr_str
 
+        moon = CelestialBody(
+            id="moon",
+            name="Moon",
+            type="moon",
+            mass=7.342e22,
+            radius=1.737e6,
+            atmosphere_pressure=0.0,
+            atmosphere_depth=0.0,
+            temperature=250.0,
+            has_atmosphere=False,
+            has_water=False,
+        )
+        moon.position = Vector3D(1.0e12, 0.0, 0.0)
+        system.add_body(moon)
 
-class TestSpacecraft:
-    """Tests for Spacecraft."""
+        position = Vector3D(1.0e11, 0.0, 0.0)
+        assert system.get_nearest_body(position).id == "sun"
+
+        # No update_positions call: queries re-read positions themselves
+        moon.position = Vector3D(1.1e11, 0.0, 0.0)
+        assert system.get_nearest_body(position).id == "moon"
+        assert system.bodies_in_cone(
+            Vector3D(0.0, 0.0, 0.0), Vector3D(1.0, 0.0, 0.0), 0.1, 1.2e11
+        ) == [moon]
+        moon.position.y = 1.0e11
+        assert system.get_nearest_body(position).id == "sun"
+        assert system.position_array[1, 1] == 1.0e11
+
+        # Re-adding a body replaces its cached position instead of duplicating it
+        moon.position = Vector3D(1.0e12, 0.0, 0.0)
+        system.add_body(moon)
+        assert system.get_nearest_body(position).id == "sun"
+        assert len(system.bodies) == 2
+
+    def test_get_nearest_body_many_bodies(self) -> None:
+        """Test nearest-body search above the KD-tree threshold."""
+        system = SolarSystem()
+        rng = np.random.default_rng(42)
+        for i, coords in enumerate(rng.uniform(-1.0e12, 1.0e12, size=(40, 3))):
+            body = CelestialBody(
+                id=f"asteroid-{i}",
+                name=f"Asteroid {i}",
+                type="asteroid",
+                mass=1.0e15,
+                radius=1.0e3,
+                atmosphere_pressure=0.0,
+                atmosphere_depth=0.0,
+                temperature=150.0,
+                has_atmosphere=False,
+                has_water=False,
+            )
+            body.position = Vector3D(*coords)
+            system.add_body(body)
+
+        for query in rng.uniform(-1.0e12, 1.0e12, size=(5, 3)):
+            position = Vector3D(*query)
+            expected = min(
+                system.bodies.values(),
+                key=lambda body: (position - body.position).magnitude(),
+            )
+            assert system.get_nearest_body(position) is expected
+
+    def test_kdtree_matches_brute_force(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the SciPy KD-tree paths agree with the brute-force scans."""
+        pytest.importorskip("scipy")
+        system = SolarSystem()
+        rng = np.random.default_rng(7)
+        count = 2 * solar_system.KDTREE_MIN_BODIES
+        for i, coords in enumerate(rng.uniform(-1.0e9, 1.0e9, size=(count, 3))):
+            body = CelestialBody(
+                id=f"planetoid-{i}",
+                name=f"Planetoid {i}",
+                type="planet",
+                mass=1.0e22,
+                radius=float(rng.uniform(1.0e6, 5.0e7)),
+                atmosphere_pressure=1.0,
+                atmosphere_depth=float(rng.uniform(1.0e6, 1.0e8)),
+                temperature=200.0,
+                has_atmosphere=bool(i % 3),
+                has_water=False,
+            )
+            body.position = Vector3D(*coords)
+            system.add_body(body)
+        assert system._tree() is not None
+
+        # Half the queries sit just off a body so some land inside atmospheres
+        bodies = list(system.bodies.values())
+        queries = [
+            bodies[i].position + Vector3D(*offset)
+            for i, offset in enumerate(rng.normal(0.0, 5.0e7, size=(count, 3)))
+        ]
+        queries += [Vector3D(*q) for q in rng.uniform(-1.0e9, 1.0e9, size=(count, 3))]
+        with_tree = [
+            (system.get_nearest_body(q), system.bodies_containing(q)) for q in queries
+        ]
+
+        monkeypatch.setattr(solar_system, "cKDTree", None)
+        assert system._tree() is None
+        brute_force = [
+            (system.get_nearest_body(q), system.bodies_containing(q)) for q in queries
+        ]
+
+        assert with_tree == brute_force
+        assert any(containing for _, containing in with_tree)
+
+        # Moving a body rebuilds the tree on the next query
+        monkeypatch.undo()
+        bodies[0].position = queries[-1]
+        assert system._tree() is not None
+        assert system.get_nearest_body(queries[-1]) is bodies[0]
+
+    def test_bodies_containing(self, earth_body: CelestialBody) -> None:
+        """Test bulk atmosphere lookup matches is_in_atmosphere per body."""
+        system = SolarSystem()
 
-    def test_get_fuel_percent_zero_capacity(self) -> None:
-        """Test fuel percentage with zero capacity."""
-        ship = Spacecraft(
-            id="ship-1",
-            name="Test Ship",
-            ship_type="scout",
-            mass=1000.0,
-            dry_mass=1000.0,
-            max_fuel_capacity=0.0,
-            current_fuel=0.0,
-            max_thrust=10000.0,
-            specific_impulse=300.0,
-            cruise_speed=100.0,
+        earth = earth_body
+        earth.position = Vector3D(1.5e11, 0.0, 0.0)
+        moon = CelestialBody(
+            id="moon",
+            name="Moon",
+            type="moon",
+            mass=7.342e22,
+            radius=1.737e6,
+            atmosphere_pressure=0.0,
+            atmosphere_depth=0.0,
+            temperature=250.0,
+            has_atmosphere=False,
+            has_water=False,
         )
+        moon.position = Vector3D(1.5e11, 3.84e8, 0.0)
+        system.add_body(earth)
+        system.add_body(moon)
+
+        in_atmosphere = Vector3D(1.5e11 + 6.4e6, 0.0, 0.0)
+        assert system.bodies_containing(in_atmosphere) == [earth]
+        # Inside the Moon, which has no atmosphere, and inside the Sun
+        assert system.bodies_containing(moon.position) == []
+        assert system.bodies_containing(Vector3D(0.0, 0.0, 0.0)) == []
+
+        for position in (in_atmosphere, moon.position, Vector3D(1.0e9, 0.0, 0.0)):
+            expected = [
+                body
+                for body in system.bodies.values()
+                if body.is_in_atmosphere(position)
+            ]
+            assert system.bodies_containing(position) == expected
+
+    def test_bodies_in_cone(self, earth_body: CelestialBody) -> None:
+        """Test cone queries from a point between the bodies."""
+        system = SolarSystem()
 
-        assert ship.get_fuel_percent() == 0.0
-
-    def test_get_fuel_percent_normal(self) -> None:
-        """Test fuel percentage calculation with normal capacity."""
-        ship = Spacecraft(
-            id="ship-1",
-            name="Test Ship",
-            ship_type="scout",
-            mass=1000.0,
-            dry_mass=800.0,
-            max_fuel_capacity=200.0,
-            current_fuel=100.0,  # 50% full
-            max_thrust=10000.0,
-            specific_impulse=300.0,
-            cruise_speed=100.0,
+        earth = earth_body
+        earth.position = Vector3D(1.5e11, 0.0, 0.0)
+        mars = CelestialBody(
+            id="mars",
+            name="Mars",
+            type="planet",
+            mass=6.39e23,
+            radius=3.39e6,
+            atmosphere_pressure=0.6,
+            atmosphere_depth=11000.0,
+            temperature=210.0,
+            has_atmosphere=True,
+            has_water=False,
         )
+        mars.position = Vector3D(1.0e9, 2.3e11, 0.0)
+        system.add_body(earth)
+        system.add_body(mars)
 
-        assert ship.get_fuel_percent() == 50.0
+        origin = Vector3D(1.0e9, 0.0, 0.0)
+        along_x = Vector3D(1.0, 0.0, 0.0)
+        assert system.bodies_in_cone(origin, along_x, math.radians(10.0)) == [earth]
+        assert system.bodies_in_cone(origin, along_x, math.radians(95.0)) == [
+            earth,
+            mars,
+        ]
+        assert system.bodies_in_cone(
+            origin, along_x, math.radians(95.0), max_distance=2.0e11
+        ) == [earth]
+        # The Sun sits behind the origin
+        assert system.bodies_in_cone(origin, -along_x, math.radians(10.0)) == [
+            system.sun
+        ]
+
+        with pytest.raises(ValueError):
+            system.bodies_in_cone(origin, Vector3D(0.0, 0.0, 0.0), 0.1)
+
+    def test_bodies_mapping(self) -> None:
+        """Test the bodies mapping is a live read-only view, replaceable whole."""
+        system = SolarSystem()
+        assert list(system.bodies) == ["sun"]
+        assert system.get_body("sun") is system.sun
+        assert system.get_body("pluto") is None
 
-    def test_consume_fuel_no_thrust(self) -> None:
-        """Test fuel consumption with no thrust."""
-        ship = Spacecraft(
-            id="ship-1",
-            name="Test Ship",
-            ship_type="scout",
-            mass=1000.0,
-            dry_mass=800.0,
-            max_fuel_capacity=200.0,
-            current_fuel=100.0,
-            max_thrust=10000.0,
-            specific_impulse=300.0,
-            cruise_speed=100.0,
-        )
-        ship.thrust_level = 0.0
+        with pytest.raises(TypeError):
+            system.bodies["pluto"] = system.sun
 
-        consumed = ship.consume_fuel(1.0)
-        assert consumed == 0.0
-        assert ship.current_fuel == 100.0
+        system.bodies = {}
+        assert len(system.bodies) == 0
+        assert system.get_body("sun") is None
 
-    def test_consume_fuel_with_boost(self) -> None:
-        """Test fuel consumption with boost active."""
-        ship = Spacecraft(
-            id="ship-1",
-            name="Test Ship",
-            ship_type="scout",
-            mass=1000.0,
-            dry_mass=800.0,
-            max_fuel_capacity=200.0,
-            current_fuel=100.0,
-            max_thrust=10000.0,
-            specific_impulse=300.0,
-            cruise_speed=100.0,
+        system.bodies = {"sun": system.sun}
+        assert system.get_body("sun") is system.sun
+        assert system.get_nearest_body(Vector3D(1.0, 0.0, 0.0)) is system.sun
+
+        # The mapping is one live view, not a fresh copy per access
+        view = system.bodies
+        assert system.bodies is view
+        moon = CelestialBody(
+            id="moon",
+            name="Moon",
+            type="moon",
+            mass=7.342e22,
+            radius=1.737e6,
+            atmosphere_pressure=0.0,
+            atmosphere_depth=0.0,
+            temperature=250.0,
+            has_atmosphere=False,
+            has_water=False,
         )
-        ship.thrust_level = 0.5
-        ship.boost_active = True
+        system.add_body(moon)
+        assert list(view) == ["sun", "moon"]
+        system.bodies = system.bodies
+        assert list(view) == ["sun", "moon"]
 
-        initial_fuel = ship.current_fuel
-        consumed = ship.consume_fuel(1.0)
+    def test_sort_by_morton(self) -> None:
+        """Test Z-order sorting keeps lookups and cached arrays consistent."""
+        system = SolarSystem()
+        # Corners of a cube around the Sun, added far from Z-order
+        corners = [(1, 1, 1), (0, 0, 1), (1, 0, 0), (0, 1, 0), (1, 1, 0)]
+        for i, (x, y, z) in enumerate(corners):
+            body = CelestialBody(
+                id=f"rock-{x}{y}{z}",
+                name=f"Rock {i}",
+                type="asteroid",
+                mass=float(i + 1),
+                radius=1.0e3,
+                atmosphere_pressure=0.0,
+                atmosphere_depth=0.0,
+                temperature=150.0,
+                has_atmosphere=False,
+                has_water=False,
+            )
+            body.position = Vector3D(x * 1.0e11, y * 1.0e11, z * 1.0e11)
+            system.add_body(body)
+
+        system.sort_by_morton()
+
+        # Z-order interleaves bits as ...zyx
+        assert list(system.bodies) == [
+            "sun",
+            "rock-100",
+            "rock-010",
+            "rock-110",
+            "rock-001",
+            "rock-111",
+        ]
+        for row, body in enumerate(system.bodies.values()):
+            assert system.get_body(body.id) is body
+            assert system.mass_array[row] == body.mass
+            np.testing.assert_array_equal(
+                system.position_array[row], body.position.to_array()
+            )
+        nearest = system.get_nearest_body(Vector3D(0.9e11, 1.0e11, 0.1e11))
+        assert nearest.id == "rock-110"
 
-        # Boost should double consumption
-        assert consumed > 0.0
-        assert ship.current_fuel < initial_fuel
-
-    def test_update_life_support_status_transitions(self) -> None:
-        """Test life support status transitions."""
-        ship = Spacecraft(
-            id="ship-1",
-            name="Test Ship",
-            ship_type="scout",
-            mass=1000.0,
-            dry_mass=800.0,
-            max_fuel_capacity=200.0,
-            current_fuel=100.0,
-            max_thrust=10000.0,
-            specific_impulse=300.0,
-            cruise_speed=100.0,
-        )
+    def test_solar_system_repr(self) -> None:
+        """Test SolarSystem string representation."""
+        system = SolarSystem()
+        repr_str = repr(system)
+        assert "SolarSystem" in repr_str
 
-        # Nominal
-        ship.oxygen_level = 60.0
-        ship.update_life_support(1.0)
-        assert ship.life_support_status == "nominal"
 
-        # Warning
-        ship.oxygen_level = 30.0
-        ship.update_life_support(1.0)
-        assert ship.life_support_status == "warning"
+class TestSpacecraft:
+    """Tests for Spacecraft."""
 
-        # Critical
-        ship.oxygen_level = 10.0
-        ship.update_life_support(1.0)
-        assert ship.life_support_status == "critical"
+    @pytest.mark.parametrize(
+        ("capacity", "fuel", "expected"),
+        [(0.0, 0.0, 0.0), (200.0, 100.0, 50.0)],
+        ids=["zero_capacity", "normal"],
+    )
+    def test_get_fuel_percent(
+        self, base_ship: Spacecraft, capacity: float, fuel: float, expected: float
+    ) -> None:
+        """Test fuel percentage, including a zero-capacity tank."""
+        base_ship.max_fuel_capacity = capacity
+        base_ship.current_fuel = fuel
+
+        assert base_ship.get_fuel_percent() == expected
+
+    def test_consume_fuel_no_thrust(self, base_ship: Spacecraft) -> None:
+        """Test fuel consumption with no thrust."""
+        base_ship.thrust_level = 0.0
 
-    def test_set_throttle_bounds(self) -> None:
-        """Test throttle setting with boundary values."""
-        ship = Spacecraft(
-            id="ship-1",
-            name="Test Ship",
-            ship_type="scout",
-            mass=1000.0,
-            dry_mass=800.0,
-            max_fuel_capacity=200.0,
-            current_fuel=100.0,
-            max_thrust=10000.0,
-            specific_impulse=300.0,
-            cruise_speed=100.0,
-        )
+        consumed = base_ship.consume_fuel(1.0)
+        assert consumed == 0.0
+        assert base_ship.current_fuel == 100.0
 
-        # Below minimum
-        ship.set_throttle(-10.0)
-        assert ship.throttle == 0.0
-        assert ship.thrust_level == 0.0
+    def test_consume_fuel_with_boost(self, base_ship: Spacecraft) -> None:
+        """Test fuel consumption with boost active."""
+        base_ship.thrust_level = 0.5
+        base_ship.boost_active = True
 
-        # Above maximum
-        ship.set_throttle(150.0)
-        assert ship.throttle == 100.0
-        assert ship.thrust_level == 1.0
+        initial_fuel = base_ship.current_fuel
+        consumed = base_ship.consume_fuel(1.0)
 
-        # Normal value
-        ship.set_throttle(50.0)
-        assert ship.throttle == 50.0
-        assert ship.thrust_level == 0.5
+        # Boost should double consumption
+        assert consumed > 0.0
+        assert base_ship.current_fuel < initial_fuel
+
+    @pytest.mark.parametrize(
+        ("oxygen", "delta_time", "expected"),
+        [
+            (60.0, 1.0, "nominal"),
+            (30.0, 1.0, "warning"),
+            (10.0, 1.0, "critical"),
+            # Thresholds themselves fall into the lower band
+            (50.0, 0.0, "warning"),
+            (20.0, 0.0, "critical"),
+        ],
+    )
+    def test_update_life_support_status_transitions(
+        self, base_ship: Spacecraft, oxygen: float, delta_time: float, expected: str
+    ) -> None:
+        """Test life support status for each oxygen band."""
+        base_ship.oxygen_level = oxygen
+        base_ship.update_life_support(delta_time)
+        assert base_ship.life_support_status == expected
+
+    @pytest.mark.parametrize(
+        ("percentage", "throttle", "thrust_level"),
+        [(-10.0, 0.0, 0.0), (150.0, 100.0, 1.0), (50.0, 50.0, 0.5)],
+        ids=["below_minimum", "above_maximum", "normal"],
+    )
+    def test_set_throttle_bounds(
+        self,
+        base_ship: Spacecraft,
+        percentage: float,
+        throttle: float,
+        thrust_level: float,
+    ) -> None:
+        """Test throttle setting with boundary values."""
+        base_ship.set_throttle(percentage)
+        assert base_ship.throttle == throttle
+        assert base_ship.thrust_level == thrust_level
 
-    def test_spacecraft_repr(self) -> None:
+    def test_spacecraft_repr(self, base_ship: Spacecraft) -> None:
         """Test Spacecraft string representation."""
-        ship = Spacecraft(
-            id="ship-1",
-            name="Test Ship",
-            ship_type="scout",
-            mass=1000.0,
-            dry_mass=800.0,
-            max_fuel_capacity=200.0,
-            current_fuel=100.0,
-            max_thrust=10000.0,
-            specific_impulse=300.0,
-            cruise_speed=100.0,
-        )
-
-        repr_str = repr(ship)
+        repr_str = repr(base_ship)
         assert "ship-1" in repr_str
         assert "Test Ship" in repr_str
         assert "scout" in repr_str
@@ -5,6 +5,10 @@ Tests for type definitions (Vector3D, Quaternion).
 from __future__ import annotations
 
 import math
+import warnings
+from collections.abc import Callable
+
+import numpy as np
 
 from src.simulator.types import Quaternion, Vector3D
 
@@ -12,48 +16,23 @@ from src.simulator.types import Quaternion, Vector3D
 class TestVector3D:
     """Tests for Vector3D."""
 
-    def test_normalize_zero_magnitude(self) -> None:
+    def test_normalize_zero_magnitude(
+        self, assert_vec_close: Callable[..., None]
+    ) -> None:
         """Test normalizing a zero vector."""
         v = Vector3D(0.0, 0.0, 0.0)
-        normalized = v.normalize()
-        assert normalized.x == 0.0
-        assert normalized.y == 0.0
-        assert normalized.z == 0.0
+        assert_vec_close(v.normalize(), (0.0, 0.0, 0.0), atol=0.0)
 
-    def test_vector_operations(self) -> None:
+    def test_vector_operations(self, assert_vec_close: Callable[..., None]) -> None:
         """Test vector operations."""
         v1 = Vector3D(1.0, 2.0, 3.0)
         v2 = Vector3D(4.0, 5.0, 6.0)
 
-        # Addition
-        result = v1 + v2
-        assert result.x == 5.0
-        assert result.y == 7.0
-        assert result.z == 9.0
-
-        # Subtraction
-        result = v1 - v2
-        assert result.x == -3.0
-        assert result.y == -3.0
-        assert result.z == -3.0
-
-        # Scalar multiplication
-        result = v1 * 2.0
-        assert result.x == 2.0
-        assert result.y == 4.0
-        assert result.z == 6.0
-
-        # Right multiplication
-        result = 2.0 * v1
-        assert result.x == 2.0
-        assert result.y == 4.0
-        assert result.z == 6.0
-
-        # Negation
-        result = -v1
-        assert result.x == -1.0
-        assert result.y == -2.0
-        assert result.z == -3.0
+        assert_vec_close(v1 + v2, (5.0, 7.0, 9.0), atol=0.0)  # Addition
+        assert_vec_close(v1 - v2, (-3.0, -3.0, -3.0), atol=0.0)  # Subtraction
+        assert_vec_close(v1 * 2.0, (2.0, 4.0, 6.0), atol=0.0)  # Scalar multiplication
+        assert_vec_close(2.0 * v1, (2.0, 4.0, 6.0), atol=0.0)  # Right multiplication
+        assert_vec_close(-v1, (-1.0, -2.0, -3.0), atol=0.0)  # Negation
 
     def test_dot_product(self) -> None:
         """Test dot product calculation."""
@@ -64,28 +43,40 @@ class TestVector3D:
         assert dot == 1.0 * 4.0 + 2.0 * 5.0 + 3.0 * 6.0
         assert dot == 32.0
 
-    def test_cross_product(self) -> None:
+    def test_cross_product(self, assert_vec_close: Callable[..., None]) -> None:
         """Test cross product calculation."""
         v1 = Vector3D(1.0, 0.0, 0.0)
         v2 = Vector3D(0.0, 1.0, 0.0)
 
-        cross = v1.cross(v2)
-        assert abs(cross.x - 0.0) < 1e-10
-        assert abs(cross.y - 0.0) < 1e-10
-        assert abs(cross.z - 1.0) < 1e-10
+        assert_vec_close(v1.cross(v2), (0.0, 0.0, 1.0))
 
     def test_magnitude(self) -> None:
         """Test magnitude calculation."""
         v = Vector3D(3.0, 4.0, 0.0)
         mag = v.magnitude()
-        assert abs(mag - 5.0) < 1e-10
+        assert math.isclose(mag, 5.0, rel_tol=0.0, abs_tol=1e-10)
 
     def test_normalize(self) -> None:
         """Test vector normalization."""
         v = Vector3D(3.0, 4.0, 0.0)
         normalized = v.normalize()
         mag = normalized.magnitude()
-        assert abs(mag - 1.0) < 1e-10
+        assert math.isclose(mag, 1.0, rel_tol=0.0, abs_tol=1e-10)
+
+    def test_normalize_batch(self) -> None:
+        """Test batch normalization matches normalize, including zero rows."""
+        vectors = np.array([[3.0, 4.0, 0.0], [0.0, 0.0, 0.0], [1.0, -2.0, 2.0]])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            normalized = Vector3D.normalize_batch(vectors)
+
+        assert normalized.shape == (3, 3)
+        for row, values in enumerate(vectors):
+            expected = Vector3D(*values).normalize()
+            np.testing.assert_allclose(
+                normalized[row], [expected.x, expected.y, expected.z], atol=1e-15
+            )
 
     def test_repr(self) -> None:
         """Test Vector3D string representation."""
@@ -110,10 +101,7 @@ class TestQuaternion:
     def test_to_euler_identity(self) -> None:
         """Test converting identity quaternion to Euler angles."""
         q = Quaternion(1.0, 0.0, 0.0, 0.0)  # Identity
-        pitch, yaw, roll = q.to_euler()
-        assert abs(pitch) < 1e-10
-        assert abs(yaw) < 1e-10
-        assert abs(roll) < 1e-10
+        np.testing.assert_allclose(q.to_euler(), (0.0, 0.0, 0.0), rtol=0.0, atol=1e-10)
 
     def test_from_euler(self) -> None:
         """Test creating quaternion from Euler angles."""
@@ -128,10 +116,28 @@ class TestQuaternion:
         assert q.z is not None
 
         # Convert back and verify
-        p2, y2, r2 = q.to_euler()
-        assert abs(pitch - p2) < 1e-6
-        assert abs(yaw - y2) < 1e-6
-        assert abs(roll - r2) < 1e-6
+        np.testing.assert_allclose(
+            q.to_euler(), (pitch, yaw, roll), rtol=0.0, atol=1e-6
+        )
+
+    def test_euler_batch_matches_scalar(self) -> None:
+        """Test batch Euler conversions match the scalar methods."""
+        pitch = np.array([0.0, math.pi / 4, -math.pi / 3])
+        yaw = np.array([0.0, math.pi / 6, 2.0])
+        roll = np.array([0.0, math.pi / 3, -0.5])
+
+        quaternions = Quaternion.from_euler_batch(pitch, yaw, roll)
+        assert quaternions.shape == (3, 4)
+        for row in range(3):
+            q = Quaternion.from_euler(pitch[row], yaw[row], roll[row])
+            np.testing.assert_allclose(
+                quaternions[row], [q.w, q.x, q.y, q.z], atol=1e-15
+            )
+
+        p2, y2, r2 = Quaternion.to_euler_batch(quaternions)
+        np.testing.assert_allclose(p2, pitch, atol=1e-12)
+        np.testing.assert_allclose(y2, yaw, atol=1e-12)
+        np.testing.assert_allclose(r2, roll, atol=1e-12)
 
     def test_normalize(self) -> None:
         """Test quaternion normalization."""
@@ -140,7 +146,7 @@ class TestQuaternion:
         mag = math.sqrt(
             normalized.w**2 + normalized.x**2 + normalized.y**2 + normalized.z**2
         )
-        assert abs(mag - 1.0) < 1e-10
+        assert math.isclose(mag, 1.0, rel_tol=0.0, abs_tol=1e-10)
 
     def test_repr(self) -> None:
         """Test Quaternion string representation."""